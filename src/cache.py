@@ -1,18 +1,45 @@
 """キャッシュ機能
 
 フォント情報とハッシュ値のキャッシュを管理します。
+キャッシュはSQLiteデータベース（~/.fontsync/cache/cache.sqlite）に保存されます。
 """
 
 import hashlib
 import json
+import os
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+# orjsonが利用可能であればシリアライズに使用する（任意の高速化、必須依存ではない）
+try:
+    import orjson
+
+    def _info_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _info_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _info_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    def _info_loads(data: Any) -> Any:
+        return json.loads(data)
+
 
 class FontCache:
-    """フォント情報のキャッシュを管理するクラス"""
+    """フォント情報のキャッシュを管理するクラス
+
+    以前はJSONファイル（hash_cache.json / info_cache.json）を参照のたびに
+    全件読み書きしていましたが、フォント数Nに対してO(N)の解析コストが
+    かかるため、SQLiteによる点参照（O(log N)）・点更新（O(1)）に移行しました。
+    """
 
     def __init__(self, cache_dir: Optional[Path] = None, ttl_hours: int = 24):
         """FontCacheの初期化
@@ -27,12 +54,59 @@ class FontCache:
             self.cache_dir = cache_dir
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.hash_cache_file = self.cache_dir / "hash_cache.json"
-        self.info_cache_file = self.cache_dir / "info_cache.json"
+        self.cache_db_file = self.cache_dir / "cache.sqlite"
         self.ttl_hours = ttl_hours
 
-        # メモリキャッシュ
-        self._memory_cache: Dict[str, Any] = {}
+        # メモリキャッシュ（LRUで上限を設け、大量スキャン時の肥大化を防ぐ）
+        self._memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._memory_cache_max_entries = 4096
+
+        # 書き込みバッファ（flush時にまとめてDBへ反映する）
+        self._dirty_hash: Dict[str, Tuple[str, str, float]] = {}
+        self._dirty_info: Dict[str, Tuple[str, str, float]] = {}
+        self._flush_threshold = 256
+
+        # 並列ハッシュ計算からも呼ばれるため、書き込みバッファと
+        # メモリキャッシュ（LRUの追い出し・並べ替え）はロックで直列化する
+        self._lock = threading.Lock()
+        self._conn = self._open_db()
+
+    def _open_db(self) -> sqlite3.Connection:
+        """キャッシュDBを開く（破損時は作り直す）
+
+        Returns:
+            SQLite接続
+        """
+        try:
+            return self._connect()
+        except sqlite3.DatabaseError:
+            # 破損したDBはキャッシュなので捨てて作り直す
+            try:
+                self.cache_db_file.unlink()
+            except OSError:
+                pass
+            return self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite接続を作成しテーブルを初期化する"""
+        conn = sqlite3.connect(
+            str(self.cache_db_file),
+            isolation_level=None,  # autocommit
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fontcache ("
+            "key TEXT PRIMARY KEY, "
+            "hash TEXT, "
+            "info TEXT, "
+            "path TEXT, "
+            "ts REAL NOT NULL)"
+        )
+        # cleanup_expiredの範囲検索用（全件走査を避ける）
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_fontcache_ts ON fontcache(ts)")
+        return conn
 
     def _get_cache_key(self, file_path: Path) -> str:
         """ファイルパスからキャッシュキーを生成
@@ -43,14 +117,42 @@ class FontCache:
         Returns:
             キャッシュキー
         """
-        # パスとファイルサイズ、更新時刻を組み合わせてキーを作成
+        # (dev, inode, サイズ, 更新時刻ns)のフィンガープリントからキーを作成
+        # （MD5より高速なBLAKE2bを使用。ローカルキー用途なので128bitで十分）。
+        # パスではなくinodeで識別するため、同期元フォルダ内でファイルを移動・
+        # リネームしただけなら再ハッシュせずキャッシュにヒットする
         try:
             stat = file_path.stat()
-            key_data = f"{file_path}:{stat.st_size}:{stat.st_mtime}"
-            return hashlib.md5(key_data.encode()).hexdigest()
+            key_data = b"%d:%d:%d:%d" % (
+                stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+            )
+            return hashlib.blake2b(key_data, digest_size=16).hexdigest()
         except Exception:
             # ファイルが存在しない場合などはパスのみでキーを作成
-            return hashlib.md5(str(file_path).encode()).hexdigest()
+            return hashlib.blake2b(os.fsencode(file_path), digest_size=16).hexdigest()
+
+    def _memory_cache_put(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """メモリキャッシュにエントリを追加（上限を超えたら最古のものを追い出す）
+
+        Args:
+            cache_key: キャッシュキー
+            entry: キャッシュエントリ
+        """
+        # 追い出し（popitem）と他スレッドのmove_to_endが競合すると
+        # KeyErrorになるため、LRUの操作は必ずロック下で行う
+        with self._lock:
+            self._memory_cache[cache_key] = entry
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self._memory_cache_max_entries:
+                self._memory_cache.popitem(last=False)
+
+    def _now(self) -> float:
+        """現在時刻を返す
+
+        TTL判定の時刻源をここに集約している。テストでは実時間を待つ
+        代わりにこのメソッドを差し替えて時計を進められる。
+        """
+        return time.time()
 
     def _is_cache_valid(self, timestamp: float) -> bool:
         """キャッシュが有効期限内かチェック
@@ -64,42 +166,8 @@ class FontCache:
         if self.ttl_hours <= 0:
             return True  # TTLが0以下の場合は常に有効
 
-        cache_time = datetime.fromtimestamp(timestamp)
-        expiry_time = cache_time + timedelta(hours=self.ttl_hours)
-        return datetime.now() < expiry_time
-
-    def _load_cache_file(self, cache_file: Path) -> Dict[str, Any]:
-        """キャッシュファイルを読み込む
-
-        Args:
-            cache_file: キャッシュファイルパス
-
-        Returns:
-            キャッシュデータ
-        """
-        if not cache_file.exists():
-            return {}
-
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            # 読み込みエラーの場合は空のキャッシュを返す
-            return {}
-
-    def _save_cache_file(self, cache_file: Path, data: Dict[str, Any]) -> None:
-        """キャッシュファイルに保存
-
-        Args:
-            cache_file: キャッシュファイルパス
-            data: 保存するデータ
-        """
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception:
-            # 保存エラーは無視（キャッシュなので）
-            pass
+        # datetimeオブジェクトの生成は高コストなので、floatのまま比較する
+        return self._now() < timestamp + self.ttl_hours * 3600
 
     def get_hash(self, file_path: Path) -> Optional[str]:
         """キャッシュからハッシュ値を取得
@@ -112,20 +180,38 @@ class FontCache:
         """
         cache_key = self._get_cache_key(file_path)
 
-        # メモリキャッシュを確認
-        if cache_key in self._memory_cache:
-            entry = self._memory_cache[cache_key]
-            if self._is_cache_valid(entry['timestamp']):
+        # メモリキャッシュを確認（取得とLRU更新の間に他スレッドの
+        # 追い出しが入らないようロック下で行う）
+        with self._lock:
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None and self._is_cache_valid(entry['timestamp']):
+                self._memory_cache.move_to_end(cache_key)
                 return entry.get('hash')
 
-        # ファイルキャッシュを確認
-        hash_cache = self._load_cache_file(self.hash_cache_file)
-        if cache_key in hash_cache:
-            entry = hash_cache[cache_key]
-            if self._is_cache_valid(entry['timestamp']):
-                # メモリキャッシュに追加
-                self._memory_cache[cache_key] = entry
-                return entry.get('hash')
+        # 未反映の書き込みバッファを先に確認する。ここでflush()すると
+        # コールドシンクの「ミス→計算→set_hash」の流れでフォントごとに
+        # 1行だけのトランザクションが走り、バッチ書き込みが無意味になる
+        with self._lock:
+            pending = self._dirty_hash.get(cache_key)
+        if pending is not None and self._is_cache_valid(pending[2]):
+            return pending[0]
+
+        try:
+            row = self._conn.execute(
+                "SELECT hash, ts FROM fontcache WHERE key = ?", (cache_key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row and row[0] is not None and self._is_cache_valid(row[1]):
+            entry = {
+                'hash': row[0],
+                'timestamp': row[1],
+                'path': str(file_path)
+            }
+            # メモリキャッシュに追加
+            self._memory_cache_put(cache_key, entry)
+            return row[0]
 
         return None
 
@@ -137,19 +223,19 @@ class FontCache:
             hash_value: ハッシュ値
         """
         cache_key = self._get_cache_key(file_path)
+        timestamp = self._now()
         entry = {
             'hash': hash_value,
-            'timestamp': time.time(),
+            'timestamp': timestamp,
             'path': str(file_path)
         }
 
-        # メモリキャッシュに保存
-        self._memory_cache[cache_key] = entry
+        # メモリキャッシュに保存し、DBへの反映はflushまで遅延する
+        self._memory_cache_put(cache_key, entry)
+        with self._lock:
+            self._dirty_hash[cache_key] = (hash_value, str(file_path), timestamp)
 
-        # ファイルキャッシュに保存
-        hash_cache = self._load_cache_file(self.hash_cache_file)
-        hash_cache[cache_key] = entry
-        self._save_cache_file(self.hash_cache_file, hash_cache)
+        self._flush_if_needed()
 
     def get_info(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """キャッシュからフォント情報を取得
@@ -162,12 +248,26 @@ class FontCache:
         """
         cache_key = self._get_cache_key(file_path)
 
-        # ファイルキャッシュを確認
-        info_cache = self._load_cache_file(self.info_cache_file)
-        if cache_key in info_cache:
-            entry = info_cache[cache_key]
-            if self._is_cache_valid(entry['timestamp']):
-                return entry.get('info')
+        # 未反映の書き込みバッファを先に確認
+        pending = self._dirty_info.get(cache_key)
+        if pending is not None and self._is_cache_valid(pending[2]):
+            try:
+                return _info_loads(pending[0])
+            except ValueError:
+                return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT info, ts FROM fontcache WHERE key = ?", (cache_key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row and row[0] is not None and self._is_cache_valid(row[1]):
+            try:
+                return _info_loads(row[0])
+            except ValueError:
+                return None
 
         return None
 
@@ -179,26 +279,64 @@ class FontCache:
             info: フォント情報
         """
         cache_key = self._get_cache_key(file_path)
-        entry = {
-            'info': info,
-            'timestamp': time.time(),
-            'path': str(file_path)
-        }
-
-        # ファイルキャッシュに保存
-        info_cache = self._load_cache_file(self.info_cache_file)
-        info_cache[cache_key] = entry
-        self._save_cache_file(self.info_cache_file, info_cache)
+        timestamp = self._now()
+
+        # コンパクトなシリアライズで保存する（整形JSONは解析コストが高い）
+        info_blob = _info_dumps(info)
+
+        with self._lock:
+            self._dirty_info[cache_key] = (info_blob, str(file_path), timestamp)
+
+        self._flush_if_needed()
+
+    def _flush_if_needed(self) -> None:
+        """書き込みバッファが閾値を超えたらflushする（安全弁）"""
+        if len(self._dirty_hash) + len(self._dirty_info) >= self._flush_threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """書き込みバッファの内容をまとめてDBに反映する"""
+        with self._lock:
+            if not self._dirty_hash and not self._dirty_info:
+                return
+
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                if self._dirty_hash:
+                    self._conn.executemany(
+                        "INSERT INTO fontcache (key, hash, path, ts) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET "
+                        "hash = excluded.hash, path = excluded.path, ts = excluded.ts",
+                        [(key, *values) for key, values in self._dirty_hash.items()],
+                    )
+                if self._dirty_info:
+                    self._conn.executemany(
+                        "INSERT INTO fontcache (key, info, path, ts) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET "
+                        "info = excluded.info, path = excluded.path, ts = excluded.ts",
+                        [(key, *values) for key, values in self._dirty_info.items()],
+                    )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                # 保存エラーは無視（キャッシュなので）
+                try:
+                    self._conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+
+            self._dirty_hash.clear()
+            self._dirty_info.clear()
 
     def clear(self) -> None:
         """すべてのキャッシュをクリア"""
-        self._memory_cache.clear()
-
-        if self.hash_cache_file.exists():
-            self.hash_cache_file.unlink()
-
-        if self.info_cache_file.exists():
-            self.info_cache_file.unlink()
+        try:
+            with self._lock:
+                self._memory_cache.clear()
+                self._dirty_hash.clear()
+                self._dirty_info.clear()
+                self._conn.execute("DELETE FROM fontcache")
+        except sqlite3.Error:
+            pass
 
     def cleanup_expired(self) -> Tuple[int, int]:
         """期限切れのキャッシュエントリを削除
@@ -206,39 +344,34 @@ class FontCache:
         Returns:
             (削除されたハッシュエントリ数, 削除された情報エントリ数)
         """
-        hash_removed = 0
-        info_removed = 0
-
-        # ハッシュキャッシュのクリーンアップ
-        hash_cache = self._load_cache_file(self.hash_cache_file)
-        valid_hash_cache = {}
-        for key, entry in hash_cache.items():
-            if self._is_cache_valid(entry.get('timestamp', 0)):
-                valid_hash_cache[key] = entry
-            else:
-                hash_removed += 1
-
-        if hash_removed > 0:
-            self._save_cache_file(self.hash_cache_file, valid_hash_cache)
-
-        # 情報キャッシュのクリーンアップ
-        info_cache = self._load_cache_file(self.info_cache_file)
-        valid_info_cache = {}
-        for key, entry in info_cache.items():
-            if self._is_cache_valid(entry.get('timestamp', 0)):
-                valid_info_cache[key] = entry
-            else:
-                info_removed += 1
-
-        if info_removed > 0:
-            self._save_cache_file(self.info_cache_file, valid_info_cache)
-
-        # メモリキャッシュもクリーンアップ
-        valid_memory_cache = {}
-        for key, entry in self._memory_cache.items():
-            if self._is_cache_valid(entry.get('timestamp', 0)):
-                valid_memory_cache[key] = entry
-        self._memory_cache = valid_memory_cache
+        if self.ttl_hours <= 0:
+            return 0, 0
+
+        self.flush()
+        cutoff = self._now() - self.ttl_hours * 3600
+
+        try:
+            with self._lock:
+                hash_removed = self._conn.execute(
+                    "SELECT COUNT(*) FROM fontcache WHERE ts < ? AND hash IS NOT NULL",
+                    (cutoff,),
+                ).fetchone()[0]
+                info_removed = self._conn.execute(
+                    "SELECT COUNT(*) FROM fontcache WHERE ts < ? AND info IS NOT NULL",
+                    (cutoff,),
+                ).fetchone()[0]
+                self._conn.execute("DELETE FROM fontcache WHERE ts < ?", (cutoff,))
+        except sqlite3.Error:
+            return 0, 0
+
+        # メモリキャッシュもクリーンアップ（走査中の他スレッドの更新で
+        # RuntimeErrorにならないようロック下で入れ替える）
+        with self._lock:
+            valid_memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+            for key, entry in self._memory_cache.items():
+                if self._is_cache_valid(entry.get('timestamp', 0)):
+                    valid_memory_cache[key] = entry
+            self._memory_cache = valid_memory_cache
 
         return hash_removed, info_removed
 
@@ -248,15 +381,44 @@ class FontCache:
         Returns:
             統計情報の辞書
         """
-        hash_cache = self._load_cache_file(self.hash_cache_file)
-        info_cache = self._load_cache_file(self.info_cache_file)
+        self.flush()
+        try:
+            hash_entries = self._conn.execute(
+                "SELECT COUNT(*) FROM fontcache WHERE hash IS NOT NULL"
+            ).fetchone()[0]
+            info_entries = self._conn.execute(
+                "SELECT COUNT(*) FROM fontcache WHERE info IS NOT NULL"
+            ).fetchone()[0]
+        except sqlite3.Error:
+            hash_entries = 0
+            info_entries = 0
 
         return {
-            'hash_entries': len(hash_cache),
-            'info_entries': len(info_cache),
+            'hash_entries': hash_entries,
+            'info_entries': info_entries,
             'memory_entries': len(self._memory_cache),
             'cache_dir': str(self.cache_dir),
             'ttl_hours': self.ttl_hours,
-            'hash_cache_size': self.hash_cache_file.stat().st_size if self.hash_cache_file.exists() else 0,
-            'info_cache_size': self.info_cache_file.stat().st_size if self.info_cache_file.exists() else 0
+            'cache_db_size': self.cache_db_file.stat().st_size if self.cache_db_file.exists() else 0
         }
+
+    def close(self) -> None:
+        """書き込みバッファをflushしてキャッシュDBの接続を閉じる"""
+        self.flush()
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+
+    def __enter__(self) -> "FontCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # GC時にも未反映の書き込みを失わないようにする
+        try:
+            self.close()
+        except Exception:
+            pass
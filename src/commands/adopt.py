@@ -178,13 +178,20 @@ def adopt_command(
             console.print("[yellow]~/Library/Fonts/ が存在しません。[/yellow]")
         return
 
+    # iterdirはエントリごとにPathを構築するため、scandirで名前だけ見て
+    # 候補を絞ってからPath化する
     candidate_fonts: List[Path] = []
-    for font_path in sorted(user_font_dir.iterdir()):
-        if font_path.suffix.lower() in (".otf", ".ttf") and not font_path.name.startswith("."):
-            candidate_fonts.append(font_path)
-
-    # ソースフォルダ内の既存ファイル名を取得（dedup 用）
-    existing_in_source = {p.name for p in source_folder.iterdir() if p.is_file()}
+    with os.scandir(user_font_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            name = entry.name
+            if not name.startswith(".") and name.lower().endswith((".otf", ".ttf")):
+                candidate_fonts.append(user_font_dir / name)
+
+    # ソースフォルダ内の既存ファイル名を取得（dedup 用）。
+    # DirEntry.is_fileはscandirが持ち帰った情報を使うため、エントリごとの
+    # statが発生しない
+    with os.scandir(source_folder) as entries:
+        existing_in_source = {e.name for e in entries if e.is_file()}
 
     # フィルタリング
     to_adopt: List[Path] = []
@@ -3,6 +3,7 @@
 同期元から削除されたフォントをシステムからも削除するコマンドです。
 """
 
+from datetime import datetime
 from typing import List, Tuple
 
 import typer
@@ -14,6 +15,7 @@ from rich.table import Table
 from ..config import ConfigManager
 from ..font_manager import FontManager
 from ..main import handle_errors
+from ..utils import get_safe_filename
 
 console = Console()
 
@@ -51,7 +53,7 @@ def clean_command(dry_run: bool) -> None:
     # 現在の同期元フォントをスキャン
     try:
         source_fonts = font_manager.scan_fonts(sync_folder)
-        source_font_names = {font.name for font in source_fonts}
+        source_font_names = frozenset(font.name for font in source_fonts)
     except Exception as e:
         console.print(f"[red]エラー: フォントのスキャンに失敗しました: {e}[/red]")
         raise typer.Exit(1)
@@ -73,14 +75,25 @@ def clean_command(dry_run: bool) -> None:
     ) as progress:
         check_task = progress.add_task("削除対象を確認中...", total=None)
 
-        for font_name, font_info in installed_fonts.items():
-            # 同期元に存在しないフォント
+        # 同期元に存在しないフォントと、実体チェックが必要なフォントを振り分け
+        fonts_to_check: List[str] = []
+        for font_name in installed_fonts:
             if font_name not in source_font_names:
                 fonts_to_remove.append((font_name, "同期元から削除済み"))
-                continue
-
-            # システム上に存在しないフォント（設定には残っているが実体がない）
-            if not font_manager.is_font_installed(font_name):
+            else:
+                fonts_to_check.append(font_name)
+
+        # システム上に存在しないフォント（設定には残っているが実体がない）。
+        # 名前ごとにis_font_installedでstatする代わりに、インストール先を
+        # 1回のscandirでスナップショットしてセット参照で判定する
+        installed_names = font_manager.snapshot_installed_names()
+        missing = {name for name in fonts_to_check
+                   if name not in installed_names
+                   and get_safe_filename(name) not in installed_names}
+
+        # 元の順序を保って削除対象に追加
+        for font_name in fonts_to_check:
+            if font_name in missing:
                 fonts_to_remove.append((font_name, "システム上に存在しない"))
 
         progress.update(check_task, completed=True)
@@ -99,7 +112,6 @@ def clean_command(dry_run: bool) -> None:
         installed_at = installed_fonts.get(font_name, {}).get("installed_at", "不明")
         if installed_at != "不明":
             try:
-                from datetime import datetime
                 installed_at = datetime.fromisoformat(installed_at).strftime("%Y-%m-%d")
             except Exception:
                 pass
@@ -134,8 +146,6 @@ def clean_command(dry_run: bool) -> None:
         delete_task = progress.add_task("フォントを削除中...", total=len(fonts_to_remove))
 
         for font_name, reason in fonts_to_remove:
-            progress.update(delete_task, description=f"削除中: {font_name}")
-
             # システムからフォントを削除（存在する場合）
             if font_manager.is_font_installed(font_name):
                 try:
@@ -143,14 +153,15 @@ def clean_command(dry_run: bool) -> None:
                 except Exception as e:
                     error_count += 1
                     errors.append(f"{font_name}: {str(e)}")
-                    progress.update(delete_task, advance=1)
+                    # 進捗は1回のupdateにまとめる（Richの再描画コストを抑える）
+                    progress.update(delete_task, description=f"削除中: {font_name}", advance=1)
                     continue
 
             # 設定から削除
             config_manager.remove_installed_font(font_name)
             success_count += 1
 
-            progress.update(delete_task, advance=1)
+            progress.update(delete_task, description=f"削除中: {font_name}", advance=1)
 
     # 設定を保存
     try:
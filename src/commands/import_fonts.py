@@ -5,7 +5,7 @@
 
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -15,10 +15,53 @@ from rich.prompt import Confirm, Prompt
 from ..config import ConfigManager
 from ..font_manager import FontManager
 from ..main import handle_errors
+from ..parallel import ParallelProcessor
+from ..utils import copy_file_fast, iter_font_files
 
 console = Console()
 
 
+def _compare_by_stat(src: Path, dest: Path) -> Optional[bool]:
+    """stat情報だけでファイルの同一性を判定する
+
+    Args:
+        src: 比較元ファイル
+        dest: 比較先ファイル
+
+    Returns:
+        True: 同一とみなせる（サイズとmtimeが一致）
+        False: 相違が確定（サイズが異なる）
+        None: stat情報だけでは判定できない（ハッシュ比較が必要）
+    """
+    try:
+        src_stat = src.stat()
+        dest_stat = dest.stat()
+    except OSError:
+        return None
+
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+
+    # copy2はmtimeを保持するため、サイズ+mtimeの一致は同一ファイルとみなせる
+    if int(src_stat.st_mtime) == int(dest_stat.st_mtime):
+        return True
+
+    return None
+
+
+def _copy_with_mtime(src: Path, dest: Path) -> None:
+    """フォントファイルをコピーし、mtimeのみ引き継ぐ
+
+    APFSではclonefileによるCoWクローン、それ以外はOSのゼロコピー機構を
+    使ったコピーになります（utils.copy_file_fast参照）。
+
+    Args:
+        src: コピー元ファイル
+        dest: コピー先ファイル
+    """
+    copy_file_fast(src, dest)
+
+
 @handle_errors
 def import_command(font_path: Optional[str], move: bool) -> None:
     """フォントを同期元フォルダにインポート
@@ -81,11 +124,9 @@ def import_command(font_path: Optional[str], move: bool) -> None:
         # ディレクトリの場合
         console.print(f"[blue]ディレクトリをスキャン中: {import_path}[/blue]")
 
-        for ext in font_manager.font_extensions:
-            fonts_to_import.extend(import_path.rglob(f"*{ext}"))
-
-        # 隠しファイルを除外
-        fonts_to_import = [f for f in fonts_to_import if not f.name.startswith(".")]
+        # 1回のディレクトリ走査で全拡張子をまとめて検出（隠しファイルは除外済み）
+        # 同一パスの重複は順序を保って除去し、余計なハッシュ計算・コピーを防ぐ
+        fonts_to_import = list(dict.fromkeys(iter_font_files(import_path)))
 
         if not fonts_to_import:
             console.print("[yellow]指定されたディレクトリにフォントファイルが見つかりませんでした。[/yellow]")
@@ -106,12 +147,75 @@ def import_command(font_path: Optional[str], move: bool) -> None:
         console.print("[yellow]操作をキャンセルしました。[/yellow]")
         raise typer.Exit(0)
 
+    # 既存ファイルとの比較に必要なハッシュを事前にまとめて並列計算しておく
+    # （size+mtimeで同一・相違が確定するペアはハッシュ計算自体が不要）
+    hash_targets: List[Path] = []
+    for font_path_item in fonts_to_import:
+        dest = sync_folder_path / font_path_item.name
+        if dest.exists() and _compare_by_stat(font_path_item, dest) is None:
+            hash_targets.append(font_path_item)
+            hash_targets.append(dest)
+
+    precomputed_hashes = {}
+    if len(hash_targets) > 8:
+        parallel = ParallelProcessor()
+        precomputed_hashes = parallel.calculate_hashes_parallel(
+            hash_targets, font_manager.calculate_hash
+        )
+
     # インポートの実行
     success_count = 0
     error_count = 0
     errors = []
     skipped_count = 0
 
+    # まず転送計画を立て（スキップ判定とコピー先の決定）、その後まとめて転送する
+    copy_tasks: List[Tuple[Path, Path]] = []
+    claimed_dests: set = set()
+
+    for font_path in fonts_to_import:
+        font_name = font_path.name
+        dest_path = sync_folder_path / font_name
+
+        # 既存ファイルのチェック
+        if dest_path.exists():
+            # まずstat情報で同一・相違を判定し、必要な場合のみハッシュ比較
+            identical = _compare_by_stat(font_path, dest_path)
+
+            if identical is None:
+                try:
+                    src_hash = precomputed_hashes.get(font_path)
+                    if src_hash is None:
+                        src_hash = font_manager.calculate_hash(font_path)
+                    dest_hash = precomputed_hashes.get(dest_path)
+                    if dest_hash is None:
+                        dest_hash = font_manager.calculate_hash(dest_path)
+                    identical = src_hash == dest_hash
+                except Exception:
+                    identical = False
+
+            if identical:
+                skipped_count += 1
+                continue
+
+        # 既存ファイルや同一バッチ内の他タスクと衝突する場合は番号を付けて保存
+        counter = 1
+        while dest_path.exists() or dest_path in claimed_dests:
+            stem = font_path.stem
+            suffix = font_path.suffix
+            dest_path = sync_folder_path / f"{stem}_{counter}{suffix}"
+            counter += 1
+
+        claimed_dests.add(dest_path)
+        copy_tasks.append((font_path, dest_path))
+
+    def transfer_func(src: Path, dest: Path) -> Path:
+        if move:
+            shutil.move(str(src), str(dest))
+        else:
+            _copy_with_mtime(src, dest)
+        return dest
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -119,47 +223,38 @@ def import_command(font_path: Optional[str], move: bool) -> None:
         TaskProgressColumn(),
         console=console,
     ) as progress:
-        import_task = progress.add_task(f"フォントを{operation}中...", total=len(fonts_to_import))
-
-        for font_path in fonts_to_import:
-            font_name = font_path.name
-            dest_path = sync_folder_path / font_name
+        import_task = progress.add_task(f"フォントを{operation}中...", total=len(copy_tasks))
 
-            progress.update(import_task, description=f"{operation}中: {font_name}")
+        if len(copy_tasks) > 8:
+            # 転送はI/Oバウンドなのでスレッドプールで並列実行する
+            parallel = ParallelProcessor()
 
-            # 既存ファイルのチェック
-            if dest_path.exists():
-                # 同じファイルか確認
-                try:
-                    src_hash = font_manager.calculate_hash(font_path)
-                    dest_hash = font_manager.calculate_hash(dest_path)
+            def progress_callback(completed: int, total: int) -> None:
+                progress.update(import_task, completed=completed)
 
-                    if src_hash == dest_hash:
-                        skipped_count += 1
-                        progress.update(import_task, advance=1)
-                        continue
-                except Exception:
-                    pass
-
-                # 異なるファイルの場合は番号を付けて保存
-                counter = 1
-                while dest_path.exists():
-                    stem = font_path.stem
-                    suffix = font_path.suffix
-                    dest_path = sync_folder_path / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-            try:
-                if move:
-                    shutil.move(str(font_path), str(dest_path))
+            results = parallel.copy_fonts_parallel(copy_tasks, transfer_func, progress_callback)
+            for success, result in results:
+                if success:
+                    success_count += 1
                 else:
-                    shutil.copy2(str(font_path), str(dest_path))
-                success_count += 1
-            except Exception as e:
-                error_count += 1
-                errors.append(f"{font_name}: {str(e)}")
-
-            progress.update(import_task, advance=1)
+                    error_count += 1
+                    src = result.get("src") if isinstance(result, dict) else None
+                    name = src.name if src is not None else "不明なファイル"
+                    errors.append(f"{name}: {result.get('error') if isinstance(result, dict) else result}")
+        else:
+            for src, dest in copy_tasks:
+                try:
+                    transfer_func(src, dest)
+                    success_count += 1
+                except Exception as e:
+                    error_count += 1
+                    errors.append(f"{src.name}: {str(e)}")
+                # 進捗は1回のupdateにまとめる（Richの再描画コストを抑える）
+                progress.update(import_task, description=f"{operation}中: {src.name}", advance=1)
+
+    # ハッシュキャッシュの書き込みバッファをまとめて反映
+    if font_manager.cache:
+        font_manager.cache.flush()
 
     # 結果を表示
     console.print()
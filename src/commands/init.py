@@ -13,6 +13,7 @@ from rich.prompt import Confirm, Prompt
 
 from ..config import ConfigManager
 from ..main import handle_errors
+from ..utils import iter_font_files
 
 console = Console()
 
@@ -116,14 +117,8 @@ def count_fonts_in_folder(folder_path: Path) -> int:
     Returns:
         int: フォントファイルの数
     """
-    font_extensions = (".otf", ".ttf")
-    count = 0
-
     try:
-        for ext in font_extensions:
-            count += len(list(folder_path.rglob(f"*{ext}")))
+        return sum(1 for _ in iter_font_files(folder_path))
     except Exception:
         # エラーが発生しても0を返す
-        pass
-
-    return count
+        return 0
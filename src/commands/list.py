@@ -3,8 +3,11 @@
 同期元フォルダ内のフォント一覧を表示するコマンドです。
 """
 
+import functools
 import json
+import sys
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 
 import typer
@@ -15,10 +18,40 @@ from rich.table import Table
 from ..config import ConfigManager
 from ..font_manager import FontManager
 from ..main import handle_errors
+from ..parallel import ParallelProcessor
 
 console = Console()
 
 
+# strftimeはロケール参照を伴い意外と高コスト。一括インストールされたフォント
+# ファミリーはmtimeを共有することが多いため、タイムスタンプをキーに結果をキャッシュする
+@functools.lru_cache(maxsize=4096)
+def _format_mtime(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_mtime_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_installed_date(installed_at: str) -> Optional[str]:
+    try:
+        return datetime.fromisoformat(installed_at).strftime("%Y-%m-%d")
+    except Exception:
+        return None
+
+
+# (is_installed, needs_update) → 状態アイコン。描画ループ内の分岐を辞書参照に置き換える
+_STATUS_ICONS = {
+    (True, True): "⚠️",
+    (True, False): "✓",
+    (False, False): "✗",
+    (False, True): "✗",
+}
+
+
 @handle_errors
 def list_command(status: Optional[str], format: Optional[str]) -> None:
     """フォント一覧を表示
@@ -48,104 +81,161 @@ def list_command(status: Optional[str], format: Optional[str]) -> None:
         console.print("[red]エラー: 同期元フォルダが設定されていません。[/red]")
         raise typer.Exit(1)
 
-    # フォントのスキャン
+    # フォントのスキャンと情報収集（バッチ単位でストリーム処理し、
+    # 全パスのリストと情報リストを同時に保持しない）。
+    # スキャンと情報収集は1つのProgressコンテキストを共有する
+    # （コンテキストごとにRichの描画スレッドが起動・終了するため分割しない）
+    font_list = []
+    installed_fonts = config_manager.get_installed_fonts()
+    parallel = ParallelProcessor()
+    total_scanned = 0
+
+    def _fingerprint_matches(font_path, installed_info) -> bool:
+        """記録済みのsize+mtimeが現在のファイルと一致するか判定する
+
+        一致すればファイルは変更されていないとみなせるため、
+        ハッシュ計算を省略できる。記録がない場合はFalse（ハッシュ比較に回す）。
+        """
+        size = installed_info.get("size")
+        mtime = installed_info.get("mtime")
+        if size is None or mtime is None:
+            return False
+        try:
+            stat = font_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == size and stat.st_mtime == mtime
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        scan_task = progress.add_task("フォントをスキャン中...", total=None)
+        scan_task = progress.add_task("フォント情報を収集中...", total=None)
 
         try:
-            source_fonts = font_manager.scan_fonts(sync_folder)
+            font_batches = font_manager.scan_fonts(sync_folder, yield_batch=True)
         except Exception as e:
             console.print(f"[red]エラー: フォントのスキャンに失敗しました: {e}[/red]")
             raise typer.Exit(1)
 
-        progress.update(scan_task, completed=True)
-
-    if not source_fonts:
-        console.print("[yellow]同期元フォルダにフォントファイルが見つかりませんでした。[/yellow]")
-        raise typer.Exit(0)
+        for font_batch in font_batches:
+            total_scanned += len(font_batch)
+            progress.update(
+                scan_task,
+                description=f"フォント情報を収集中... ({total_scanned}個)",
+            )
 
-    # フォント情報を収集
-    font_list = []
-    installed_fonts = config_manager.get_installed_fonts()
+            # インストール済みフォントの最新判定に必要なハッシュをバッチ単位で並列計算
+            # （size+mtimeが記録と一致するフォントはハッシュ計算自体が不要。
+            # Path.nameの再解析と辞書参照をパスごとに1回ずつに抑える）
+            hash_targets = []
+            if status != "not-installed":
+                # 未インストールのみ表示する場合、ハッシュは一切使われない
+                for p in font_batch:
+                    record = installed_fonts.get(p.name)
+                    if record is not None and not _fingerprint_matches(p, record):
+                        hash_targets.append(p)
+            precomputed_hashes = {}
+            if len(hash_targets) > 50:
+                precomputed_hashes = parallel.calculate_hashes_parallel(
+                    hash_targets, font_manager.calculate_hash
+                )
+
+            for font_path in font_batch:
+                font_name = font_path.name
+
+                # インストール状態を確認（辞書参照は1回にまとめる）。
+                # フィルタで除外されるフォントは情報取得・ハッシュ計算の前に弾く
+                installed_info = installed_fonts.get(font_name)
+                is_installed = installed_info is not None
+                if status == "installed" and not is_installed:
+                    continue
+                if status == "not-installed" and is_installed:
+                    continue
+                if installed_info is None:
+                    installed_info = {}
+
+                # フォント情報を取得
+                try:
+                    info = font_manager.get_font_info(font_path)
+                except Exception as e:
+                    console.print(f"[red]警告: {font_name} の情報取得に失敗しました: {e}[/red]")
+                    continue
+
+                # 最新かどうかを確認（size+mtimeが一致すればハッシュ計算を省略）
+                needs_update = False
+                if is_installed:
+                    if (
+                        installed_info.get("size") == info["size"]
+                        and installed_info.get("mtime") == info["modified"]
+                    ):
+                        needs_update = False
+                    else:
+                        try:
+                            current_hash = precomputed_hashes.get(font_path)
+                            if current_hash is None:
+                                current_hash = font_manager.calculate_hash(font_path)
+                            stored_hash = installed_info.get("hash")
+                            needs_update = current_hash != stored_hash
+                        except Exception:
+                            pass
+
+                # メモ欄は収集時に確定させる（描画ループはセルを並べるだけにする）
+                installed_at = installed_info.get("installed_at")
+                notes = []
+                if needs_update:
+                    notes.append("要更新")
+                if is_installed and installed_at:
+                    installed_date = _format_installed_date(installed_at)
+                    if installed_date is not None:
+                        notes.append(f"インストール: {installed_date}")
+
+                font_data = {
+                    "_sort_key": font_name.lower(),
+                    "name": font_name,
+                    "path": str(font_path),
+                    "size": info["size"],
+                    "size_mb": info["size_mb"],
+                    "modified": info["modified"],
+                    "is_installed": is_installed,
+                    "needs_update": needs_update,
+                    "installed_at": installed_at,
+                    "notes": ", ".join(notes) if notes else "-",
+                }
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        info_task = progress.add_task("フォント情報を収集中...", total=None)
+                font_list.append(font_data)
 
-        for font_path in source_fonts:
-            font_name = font_path.name
+        progress.update(scan_task, completed=True)
 
-            # フォント情報を取得
-            try:
-                info = font_manager.get_font_info(font_path)
-            except Exception as e:
-                console.print(f"[red]警告: {font_name} の情報取得に失敗しました: {e}[/red]")
-                continue
+    if not font_list and total_scanned == 0:
+        console.print("[yellow]同期元フォルダにフォントファイルが見つかりませんでした。[/yellow]")
+        raise typer.Exit(0)
 
-            # インストール状態を確認
-            is_installed = font_name in installed_fonts
-            installed_info = installed_fonts.get(font_name, {})
+    # フィルタリングは収集ループ内で適用済み
 
-            # ハッシュを計算して最新かどうか確認
-            needs_update = False
-            if is_installed:
-                try:
-                    current_hash = font_manager.calculate_hash(font_path)
-                    stored_hash = installed_info.get("hash")
-                    needs_update = current_hash != stored_hash
-                except Exception:
-                    pass
-
-            font_data = {
-                "name": font_name,
-                "path": str(font_path),
-                "size": info["size"],
-                "size_mb": info["size_mb"],
-                "modified": datetime.fromtimestamp(info["modified"]),
-                "is_installed": is_installed,
-                "needs_update": needs_update,
-                "installed_at": installed_info.get("installed_at")
-            }
-
-            font_list.append(font_data)
-
-        progress.update(info_task, completed=True)
-
-    # フィルタリング
-    if status == "installed":
-        font_list = [f for f in font_list if f["is_installed"]]
-    elif status == "not-installed":
-        font_list = [f for f in font_list if not f["is_installed"]]
-
-    # ソート（名前順）
-    font_list.sort(key=lambda x: x["name"].lower())
+    # ソート（名前順）。キーは収集時にlower()済みで、itemgetterはC実装のため
+    # ソート中のPythonレベルの呼び出しと一時文字列の生成が発生しない
+    font_list.sort(key=itemgetter("_sort_key"))
 
     # 出力
     if format == "json":
-        # JSON形式で出力
+        # JSON形式で出力。収集済みのfont_dataをそのまま流用し、テーブル専用の
+        # フィールドだけ取り除く。Richを介さずsys.stdoutへ直接ストリーム出力する
+        # ことで、巨大な中間文字列の構築と再ハイライト処理を避ける
+        for f in font_list:
+            f["modified"] = _format_mtime_iso(f["modified"])
+            del f["_sort_key"]
+            del f["path"]
+            del f["size"]
+            del f["notes"]
         output = {
             "sync_folder": sync_folder,
             "total_fonts": len(font_list),
-            "fonts": [
-                {
-                    "name": f["name"],
-                    "size_mb": f["size_mb"],
-                    "modified": f["modified"].isoformat(),
-                    "is_installed": f["is_installed"],
-                    "needs_update": f["needs_update"],
-                    "installed_at": f["installed_at"]
-                }
-                for f in font_list
-            ]
+            "fonts": font_list,
         }
-        console.print(json.dumps(output, indent=2, ensure_ascii=False))
+        json.dump(output, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
     else:
         # テーブル形式で出力
         table = Table(title=f"フォント一覧 - {sync_folder}")
@@ -156,33 +246,22 @@ def list_command(status: Optional[str], format: Optional[str]) -> None:
         table.add_column("更新日時", style="green")
         table.add_column("メモ", style="yellow")
 
+        # サマリー用のカウントは描画ループ内で同時に行う（リストの再走査を避ける）
+        installed = 0
+        needs_update = 0
+
         for font in font_list:
-            # 状態アイコン
             if font["is_installed"]:
+                installed += 1
                 if font["needs_update"]:
-                    status_icon = "⚠️"
-                else:
-                    status_icon = "✓"
-            else:
-                status_icon = "✗"
-
-            # メモ
-            notes = []
-            if font["needs_update"]:
-                notes.append("要更新")
-            if font["is_installed"] and font["installed_at"]:
-                try:
-                    installed_date = datetime.fromisoformat(font["installed_at"]).strftime("%Y-%m-%d")
-                    notes.append(f"インストール: {installed_date}")
-                except Exception:
-                    pass
+                    needs_update += 1
 
             table.add_row(
-                status_icon,
+                _STATUS_ICONS[(font["is_installed"], font["needs_update"])],
                 font["name"],
                 f"{font['size_mb']} MB",
-                font["modified"].strftime("%Y-%m-%d %H:%M"),
-                ", ".join(notes) if notes else "-"
+                _format_mtime(font["modified"]),
+                font["notes"],
             )
 
         console.print(table)
@@ -190,9 +269,7 @@ def list_command(status: Optional[str], format: Optional[str]) -> None:
         # サマリー
         console.print()
         total = len(font_list)
-        installed = sum(1 for f in font_list if f["is_installed"])
         not_installed = total - installed
-        needs_update = sum(1 for f in font_list if f["needs_update"])
 
         console.print(f"[bold]合計:[/bold] {total}個のフォント")
         console.print(f"  [green]✓ インストール済み:[/green] {installed}個")
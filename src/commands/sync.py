@@ -5,9 +5,22 @@
 """
 
 import json
+import sys
 from datetime import datetime
+
+# orjsonが利用可能であればシリアライズに使用する（任意の高速化、必須依存ではない）
+try:
+    import orjson
+
+    def _result_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _result_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -17,7 +30,7 @@ from ..config import ConfigManager
 from ..font_manager import FontManager
 from ..main import handle_errors
 from ..parallel import ParallelProcessor
-from ..utils import batch_process, check_disk_space
+from ..utils import check_disk_space
 
 console = Console()
 
@@ -39,7 +52,16 @@ def _output_json(
         "errors": errors or [],
         "sources": sources or [],
     }
-    print(json.dumps(result, ensure_ascii=False))
+    # テキスト層のエンコード・行バッファリングを介さずバイト列のまま書き出す
+    data = _result_dumps(result) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        # stdoutが差し替えられている環境（テストランナー等）向けのフォールバック
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
 
 
 def _sync_source(
@@ -71,13 +93,103 @@ def _sync_source(
     if not json_output:
         console.print(f"\n[bold]ソース:[/bold] [cyan]{source_label}[/cyan] ({sync_folder})")
 
-    # フォントのスキャン
-    all_source_fonts = []
+    # スキャンと差分チェックをバッチ単位でストリーム処理する。
+    # 全パスを1つのリストに溜め込まず、各バッチを「ハッシュ計算→分類→破棄」
+    # するため、ピークメモリは同期対象リスト＋1バッチ分に収まる
+    fonts_to_sync = []
+    fonts_to_update = []
+    up_to_date_count = 0
+    total_size_mb = 0.0
+    total_scanned = 0
+    installed_fonts = config_manager.get_installed_fonts()
+    # ネストした辞書参照を避けるため、name→hashとname→(size, mtime)の
+    # フラットな辞書を事前に作る（ホットループでは1回の.getで済ませる）
+    installed_hashes = {
+        name: info.get("hash") for name, info in installed_fonts.items()
+    }
+    installed_sigs = {
+        name: (info.get("size"), info.get("mtime"))
+        for name, info in installed_fonts.items()
+    }
+
+    # 情報取得とハッシュ計算を1回の並列パスにまとめる
+    # （ロック中・同期中のフォントはハッシュ計算自体をスキップ）。
+    # get_font_infoはFontCacheがsize+mtimeをキーに記憶しているため、
+    # コマンドをまたいだ再呼び出しもstat+パースの再実行にはならない。
+    # 分類に必要なのはsize_mbだけなので、info辞書全体は保持しない
+    def probe_font(font_path: Path):
+        """(path, size_mb, hash, up_to_date) を返す
+
+        記録済みのsize+mtimeが現在のファイルと一致すれば、内容は変わって
+        いないとみなしてハッシュ計算ごと省略する（up_to_date=True）。
+        記録がない場合や不一致の場合のみハッシュを計算して比較に回す。
+        """
+        info = font_manager.get_font_info(font_path)
+        if info.get("is_locked") or info.get("is_syncing"):
+            return font_path, info["size_mb"], None, False
+
+        # 記録がない場合sigはNone、size/mtime未記録の場合は(None, None)で、
+        # どちらも実ファイルの(size, mtime)とは一致しないためハッシュ比較に回る
+        sig = installed_sigs.get(font_path.name)
+        if sig is not None and sig == (info["size"], info["modified"]):
+            return font_path, info["size_mb"], None, True
+
+        return font_path, info["size_mb"], font_manager.calculate_hash(font_path), False
+
+    # ハッシュ計算はhashlib内でGILを解放するため、件数に関わらずスレッドプールで
+    # 処理する（スレッド起動コストはms単位で、50個のしきい値分岐を持つ価値がない）
+    parallel = ParallelProcessor()
+    probe_errors: List[str] = []
+
+    def classify_batch(font_batch: List[Path]) -> None:
+        """1バッチ分のフォントを並列にプローブし、スキャン順に分類する"""
+        nonlocal up_to_date_count, total_size_mb
+
+        probe_results = {}
+        for success, result in parallel.process_batch(font_batch, probe_font):
+            if success:
+                probe_results[result[0]] = (result[1], result[2], result[3])
+            elif not json_output:
+                item = result.get("item") if isinstance(result, dict) else None
+                name = item.name if item is not None else "不明なファイル"
+                error = result.get("error") if isinstance(result, dict) else result
+                # Progress表示中のconsole.printは1件ごとに再描画を挟むため、
+                # エラーはバッファしてスキャン完了後にまとめて出力する
+                probe_errors.append(f"エラー: {name} の処理中にエラーが発生しました: {error}")
+
+        # 表示順を安定させるため、スキャン順に分類する
+        # （Path.nameはアクセスごとにパス文字列を再解析するため、1度だけ取り出す。
+        # 辞書・リストのメソッドもループ外でローカルに束縛して参照コストを抑える）
+        probed_get = probe_results.get
+        installed_get = installed_hashes.get
+        sync_append = fonts_to_sync.append
+        update_append = fonts_to_update.append
+        missing = object()
+        for font_path, font_name in ((p, p.name) for p in font_batch):
+            probed = probed_get(font_path)
+            if probed is None:
+                continue
+            size_mb, font_hash, up_to_date = probed
+            if up_to_date:
+                up_to_date_count += 1
+                continue
+            if font_hash is None:
+                continue
+            stored_hash = installed_get(font_name, missing)
+            if stored_hash is missing:
+                sync_append((font_path, font_hash))
+                total_size_mb += size_mb
+            elif stored_hash != font_hash:
+                update_append((font_path, font_hash))
+                total_size_mb += size_mb
+            else:
+                up_to_date_count += 1
 
     if json_output:
         try:
             for font_batch in font_manager.scan_fonts(sync_folder, yield_batch=True):
-                all_source_fonts.extend(font_batch)
+                total_scanned += len(font_batch)
+                classify_batch(font_batch)
         except Exception as e:
             return {
                 "source_id": source_id,
@@ -91,14 +203,16 @@ def _sync_source(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             transient=True,
+            refresh_per_second=4,
         ) as progress:
-            scan_task = progress.add_task("フォントをスキャン中...", total=None)
+            diff_task = progress.add_task("フォントをスキャン・差分確認中...", total=None)
             try:
                 for font_batch in font_manager.scan_fonts(sync_folder, yield_batch=True):
-                    all_source_fonts.extend(font_batch)
+                    total_scanned += len(font_batch)
+                    classify_batch(font_batch)
                     progress.update(
-                        scan_task,
-                        description=f"フォントをスキャン中... ({len(all_source_fonts)}個)",
+                        diff_task,
+                        description=f"フォントをスキャン・差分確認中... ({total_scanned}個)",
                     )
             except Exception as e:
                 console.print(f"[red]エラー: フォントのスキャンに失敗しました: {e}[/red]")
@@ -109,9 +223,12 @@ def _sync_source(
                     "skipped": 0,
                     "errors": [f"フォントのスキャンに失敗しました: {e}"],
                 }
-            progress.update(scan_task, completed=True)
+            progress.update(diff_task, completed=True)
 
-    if not all_source_fonts:
+    if probe_errors and not json_output:
+        console.print("[red]" + "\n".join(probe_errors) + "[/red]")
+
+    if total_scanned == 0:
         if not json_output:
             console.print("[yellow]同期元フォルダにフォントファイルが見つかりませんでした。[/yellow]")
         return {
@@ -123,88 +240,10 @@ def _sync_source(
         }
 
     if not json_output:
-        console.print(f"[blue]ℹ {len(all_source_fonts)}個のフォントファイルが見つかりました。[/blue]")
-
-    # 差分チェック
-    fonts_to_sync = []
-    fonts_to_update = []
-    fonts_up_to_date = []
-    total_size_mb = 0.0
-    installed_fonts = config_manager.get_installed_fonts()
-    use_parallel = len(all_source_fonts) > 50
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        transient=True,
-    ) as progress:
-        diff_task = progress.add_task("差分を確認中...", total=len(all_source_fonts))
-
-        if use_parallel and not json_output:
-            parallel = ParallelProcessor()
-
-            def progress_callback(completed: int, total: int):
-                progress.update(diff_task, completed=completed)
-
-            hash_results = parallel.calculate_hashes_parallel(
-                all_source_fonts, font_manager.calculate_hash, progress_callback
-            )
-            for font_path in all_source_fonts:
-                font_name = font_path.name
-                info = font_manager.get_font_info(font_path)
-                size_mb = info["size_mb"]
-                if info.get("is_locked") or info.get("is_syncing"):
-                    continue
-                font_hash = hash_results.get(font_path)
-                if font_hash is None:
-                    continue
-                if font_name not in installed_fonts:
-                    fonts_to_sync.append((font_path, font_hash))
-                    total_size_mb += size_mb
-                elif installed_fonts[font_name].get("hash") != font_hash:
-                    fonts_to_update.append((font_path, font_hash))
-                    total_size_mb += size_mb
-                else:
-                    fonts_up_to_date.append(font_path)
-        else:
-            def check_font_diff(font_path: Path) -> Dict:
-                font_name = font_path.name
-                result = {"path": font_path, "action": "none", "hash": None, "size_mb": 0}
-                try:
-                    info = font_manager.get_font_info(font_path)
-                    result["size_mb"] = info["size_mb"]
-                    if info.get("is_locked") or info.get("is_syncing"):
-                        return result
-                    font_hash = font_manager.calculate_hash(font_path)
-                    result["hash"] = font_hash
-                    if font_name not in installed_fonts:
-                        result["action"] = "install"
-                    elif installed_fonts[font_name].get("hash") != font_hash:
-                        result["action"] = "update"
-                    else:
-                        result["action"] = "up-to-date"
-                except Exception as e:
-                    if not json_output:
-                        console.print(f"[red]エラー: {font_name} の処理中にエラーが発生しました: {e}[/red]")
-                progress.update(diff_task, advance=1)
-                return result
-
-            results = batch_process(all_source_fonts, check_font_diff, batch_size=50)
-            for result in results:
-                if isinstance(result, dict) and not result.get("error"):
-                    if result["action"] == "install":
-                        fonts_to_sync.append((result["path"], result["hash"]))
-                        total_size_mb += result["size_mb"]
-                    elif result["action"] == "update":
-                        fonts_to_update.append((result["path"], result["hash"]))
-                        total_size_mb += result["size_mb"]
-                    elif result["action"] == "up-to-date":
-                        fonts_up_to_date.append(result["path"])
+        console.print(f"[blue]ℹ {total_scanned}個のフォントファイルが見つかりました。[/blue]")
 
     total_to_sync = len(fonts_to_sync) + len(fonts_to_update)
-    skipped_count = len(fonts_up_to_date)
+    skipped_count = up_to_date_count
 
     if total_to_sync == 0:
         if not json_output:
@@ -235,27 +274,72 @@ def _sync_source(
     if not json_output:
         console.print(f"[bold]{total_to_sync}個のフォント（合計 {total_size_mb:.1f}MB）を同期します。[/bold]")
 
-    def install_font(font_path, font_hash):
-        nonlocal added_count, updated_count
-        font_name = font_path.name
-        try:
-            font_manager.copy_font(font_path, validate=True)
-            config_manager.add_installed_font(font_name, font_hash)
-            return True
-        except Exception as e:
-            error_msg = str(e)
-            if hasattr(e, "hint") and e.hint:
-                error_msg += f" ({e.hint})"
-            errors.append(f"{font_name}: {error_msg}")
-            return False
+    # インストール日時は同期実行ごとに1度だけ生成する
+    sync_timestamp = datetime.now().isoformat()
 
-    if json_output:
-        for font_path, font_hash in fonts_to_sync:
-            if install_font(font_path, font_hash):
+    # インストールと更新を1つの作業リストにまとめる
+    work_items = [(path, h, "install") for path, h in fonts_to_sync]
+    work_items += [(path, h, "update") for path, h in fonts_to_update]
+
+    def copy_item(item) -> Tuple[str, str, str, Optional[int], Optional[float]]:
+        """フォントをコピーする（設定の更新は行わない）
+
+        ワーカーからはコピー結果だけを返し、installed_fontsへの記録は
+        主スレッドでまとめて行う。config辞書を複数スレッドから触らないため
+        ロックが不要になり、I/Oバウンドなコピーが完全に並列化できる。
+        """
+        font_path, font_hash, action = item
+        font_manager.copy_font(font_path, validate=True)
+        # size+mtimeも記録しておくと、以降のlist/syncでハッシュ計算を省略できる
+        try:
+            stat = font_path.stat()
+            size, mtime = stat.st_size, stat.st_mtime
+        except OSError:
+            size, mtime = None, None
+        return action, font_path.name, font_hash, size, mtime
+
+    def copy_error(item, e: Exception) -> Dict[str, str]:
+        error_msg = str(e)
+        if hasattr(e, "hint") and e.hint:
+            error_msg += f" ({e.hint})"
+        return {"name": item[0].name, "error": error_msg}
+
+    def record_result(success: bool, result) -> None:
+        """コピー結果を主スレッドで設定・カウンタに反映する"""
+        nonlocal added_count, updated_count
+        if success:
+            action, font_name, font_hash, size, mtime = result
+            config_manager.add_installed_font(
+                font_name, font_hash, installed_at=sync_timestamp, size=size, mtime=mtime
+            )
+            if action == "install":
                 added_count += 1
-        for font_path, font_hash in fonts_to_update:
-            if install_font(font_path, font_hash):
+            else:
                 updated_count += 1
+        else:
+            errors.append(f"{result['name']}: {result['error']}")
+
+    def execute_work(progress=None, sync_task=None) -> None:
+        """作業リストを実行する（JSON出力時はprogress=None）
+
+        コピーはI/Oバウンドでsyscall中にGILを手放すため、件数に関わらず
+        スレッドプールで並列実行する（差分チェックと同じ方針）。
+        """
+        progress_callback = None
+        if progress is not None:
+            # 進捗バーの更新は16件ごとにまとめる（Richのタスク更新も
+            # ロック取得を伴うため、完了ごとに呼ぶと件数分のコストになる）
+            def progress_callback(completed: int, total: int) -> None:
+                if completed % 16 == 0 or completed == total:
+                    progress.update(sync_task, completed=completed)
+
+        for success, result in parallel.process_batch(
+            work_items, copy_item, progress_callback, copy_error
+        ):
+            record_result(success, result)
+
+    if json_output:
+        execute_work()
     else:
         with Progress(
             SpinnerColumn(),
@@ -263,18 +347,10 @@ def _sync_source(
             BarColumn(),
             TaskProgressColumn(),
             console=console,
+            refresh_per_second=4,
         ) as progress:
             sync_task = progress.add_task("フォントを同期中...", total=total_to_sync)
-            for font_path, font_hash in fonts_to_sync:
-                progress.update(sync_task, description=f"インストール中: {font_path.name}")
-                if install_font(font_path, font_hash):
-                    added_count += 1
-                progress.update(sync_task, advance=1)
-            for font_path, font_hash in fonts_to_update:
-                progress.update(sync_task, description=f"更新中: {font_path.name}")
-                if install_font(font_path, font_hash):
-                    updated_count += 1
-                progress.update(sync_task, advance=1)
+            execute_work(progress, sync_task)
 
     return {
         "source_id": source_id,
@@ -11,6 +11,29 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# orjsonが利用可能であればシリアライズに使用する（任意の高速化、必須依存ではない）
+try:
+    import orjson
+
+    def _config_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _config_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    _CONFIG_DECODE_ERROR = orjson.JSONDecodeError
+
+except ImportError:
+    orjson = None
+
+    def _config_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _config_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    _CONFIG_DECODE_ERROR = json.JSONDecodeError
+
 
 class ConfigManager:
     """設定管理クラス
@@ -26,6 +49,10 @@ class ConfigManager:
         self.config_dir = Path.home() / ".fontsync"
         self.config_file = self.config_dir / "config.json"
         self.config: Dict[str, Any] = {}
+        # 読み込み済み設定のmtime（変更がなければ再パースしない）
+        self._loaded_mtime_ns: Optional[int] = None
+        # 読み込み後に変更があったか（なければsave_configは書き込みを省略する）
+        self._dirty = False
 
     def load_config(self) -> Dict[str, Any]:
         """設定ファイルを読み込む
@@ -39,13 +66,24 @@ class ConfigManager:
         if not self.config_file.exists():
             raise FileNotFoundError(f"設定ファイルが見つかりません: {self.config_file}")
 
+        # ファイルが変更されていなければ読み込み済みの設定を返す
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if self.config and mtime_ns is not None and mtime_ns == self._loaded_mtime_ns:
+            return self.config
+
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                self.config = json.load(f)
-        except json.JSONDecodeError as e:
+            with open(self.config_file, "rb") as f:
+                self.config = _config_loads(f.read())
+        except _CONFIG_DECODE_ERROR as e:
             raise ValueError(f"設定ファイルの形式が不正です: {e}")
 
+        self._dirty = False
         self._migrate_v1_to_v2()
+        self._loaded_mtime_ns = mtime_ns
 
         return self.config
 
@@ -56,6 +94,7 @@ class ConfigManager:
 
         sync_folder = self.config.get("sync_folder")
         if sync_folder:
+            self._dirty = True
             self.config["schema_version"] = 2
             self.config["sources"] = [
                 {
@@ -69,18 +108,36 @@ class ConfigManager:
     def save_config(self) -> None:
         """現在の設定をファイルに保存する
 
+        読み込み後に変更がない場合はシリアライズも書き込みも行わない
+        （installed_fontsが大きいと全体の再書き出しが多数のフォント分の
+        コストになるため）。書き込みは一時ファイル＋os.replaceでアトミックに
+        行い、途中でクラッシュしても既存の設定ファイルが壊れないようにする。
+
         Raises:
             IOError: ファイルの書き込みに失敗した場合
         """
+        if not self._dirty and self.config_file.exists():
+            return
+
         # 設定ディレクトリが存在しない場合は作成
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(_config_dumps(self.config))
+            os.replace(tmp_file, self.config_file)
         except IOError as e:
             raise IOError(f"設定ファイルの保存に失敗しました: {e}")
 
+        self._dirty = False
+
+        # 保存した内容はメモリ上の設定と一致しているので再読み込み不要
+        try:
+            self._loaded_mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            self._loaded_mtime_ns = None
+
     def get_sources(self) -> List[Dict[str, Any]]:
         """同期元ソース一覧を取得
 
@@ -110,6 +167,7 @@ class ConfigManager:
         if "sources" not in self.config:
             self.config["sources"] = []
 
+        self._dirty = True
         source = {
             "id": str(uuid.uuid4()),
             "label": label,
@@ -133,6 +191,7 @@ class ConfigManager:
         if len(new_sources) == len(sources):
             return False
         self.config["sources"] = new_sources
+        self._dirty = True
         return True
 
     def update_source(self, source_id: str, updates: Dict[str, Any]) -> bool:
@@ -148,6 +207,7 @@ class ConfigManager:
         for source in self.config.get("sources", []):
             if source["id"] == source_id:
                 source.update(updates)
+                self._dirty = True
                 return True
         return False
 
@@ -168,6 +228,7 @@ class ConfigManager:
         # パスを展開（~/を実際のホームディレクトリに変換）
         expanded_path = os.path.expanduser(folder_path)
         self.config["sync_folder"] = expanded_path
+        self._dirty = True
 
     def get_installed_fonts(self) -> Dict[str, Dict[str, Any]]:
         """インストール済みフォントの情報を取得
@@ -177,20 +238,39 @@ class ConfigManager:
         """
         return self.config.get("installed_fonts", {})
 
-    def add_installed_font(self, font_name: str, font_hash: str) -> None:
+    def add_installed_font(
+        self,
+        font_name: str,
+        font_hash: str,
+        installed_at: Optional[str] = None,
+        size: Optional[int] = None,
+        mtime: Optional[float] = None,
+    ) -> None:
         """インストール済みフォントを記録
 
         Args:
             font_name (str): フォントファイル名
             font_hash (str): フォントファイルのハッシュ値
+            installed_at (Optional[str]): インストール日時（ISO形式）。
+                Noneの場合は現在時刻。一括登録時は呼び出し側で1度だけ生成して渡せる
+            size (Optional[int]): 同期元ファイルのサイズ（バイト）
+            mtime (Optional[float]): 同期元ファイルの更新日時（epoch秒）。
+                size/mtimeが記録されていれば、最新判定をハッシュ計算なしで行える
         """
         if "installed_fonts" not in self.config:
             self.config["installed_fonts"] = {}
 
-        self.config["installed_fonts"][font_name] = {
+        entry: Dict[str, Any] = {
             "hash": font_hash,
-            "installed_at": datetime.now().isoformat()
+            "installed_at": installed_at or datetime.now().isoformat()
         }
+        if size is not None:
+            entry["size"] = size
+        if mtime is not None:
+            entry["mtime"] = mtime
+
+        self.config["installed_fonts"][font_name] = entry
+        self._dirty = True
 
     def remove_installed_font(self, font_name: str) -> None:
         """インストール済みフォントの記録を削除
@@ -200,6 +280,7 @@ class ConfigManager:
         """
         if "installed_fonts" in self.config and font_name in self.config["installed_fonts"]:
             del self.config["installed_fonts"][font_name]
+            self._dirty = True
 
     def is_font_installed(self, font_name: str) -> bool:
         """フォントがインストール済みか確認
@@ -238,6 +319,7 @@ class ConfigManager:
             "created_at": datetime.now().isoformat(),
             "version": "1.0"
         }
+        self._dirty = True
         self.save_config()
 
     def config_exists(self) -> bool:
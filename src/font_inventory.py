@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from .utils import iter_font_files
+
 logger = logging.getLogger(__name__)
 
 # サポートする拡張子
@@ -196,14 +198,9 @@ def enumerate_installed_fonts(
         if not scan_dir.exists():
             continue
 
-        for font_path in sorted(scan_dir.rglob("*")):
-            if not font_path.is_file():
-                continue
-            if font_path.suffix.lower() not in _FONT_EXTENSIONS:
-                continue
-            if font_path.name.startswith("."):
-                continue
-
+        # rglob("*")は全ファイルを列挙してから絞り込むため、
+        # scandirベースの走査で拡張子判定まで済ませる
+        for font_path in sorted(iter_font_files(scan_dir, _FONT_EXTENSIONS)):
             # 0 バイトファイルはスキップ
             try:
                 if font_path.stat().st_size == 0:
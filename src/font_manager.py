@@ -3,9 +3,10 @@
 フォントファイルの検出、ハッシュ計算、インストール処理などを行います。
 """
 
+import concurrent.futures
 import hashlib
+import mmap
 import os
-import shutil
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
 
@@ -14,14 +15,40 @@ from .utils import (
     FileLockedError,
     FontValidationError,
     check_disk_space,
+    copy_file_fast,
     get_safe_filename,
     is_cloud_storage_syncing,
     is_file_locked,
+    iter_font_files,
     retry_on_error,
     validate_font_file_advanced,
     wait_for_file_unlock,
 )
 
+# このサイズを超えるファイルはmmapを16MBの窓に区切ってハッシュ関数へ渡す
+_MMAP_WINDOW_THRESHOLD = 64 * 1024 * 1024
+_MMAP_WINDOW_SIZE = 16 * 1024 * 1024
+
+
+def _advise_sequential_read(fd: int) -> None:
+    """ファイル全体を先頭から読むことをカーネルに伝える
+
+    ページキャッシュに乗っていないファイルでは先読みが効くかどうかで
+    ハッシュ計算の所要時間が変わる。Linuxではposix_fadvise、macOSでは
+    fcntlのF_RDAHEADで逐次読み取りのヒントを与える。あくまでヒントなので
+    失敗しても無視してよい。
+    """
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            import fcntl
+            if hasattr(fcntl, "F_RDAHEAD"):
+                fcntl.fcntl(fd, fcntl.F_RDAHEAD, 1)
+    except OSError:
+        pass
+
 
 class FontManager:
     """フォント管理クラス
@@ -42,9 +69,14 @@ class FontManager:
             use_cache: キャッシュを使用するか
         """
         self.font_extensions: Tuple[str, ...] = (".otf", ".ttf", ".OTF", ".TTF")
+        # 走査時の判定用（小文字で比較するため大文字小文字の組み合わせを網羅できる）
+        self._font_extension_set = frozenset(ext.lower() for ext in self.font_extensions)
         self.font_install_dir = Path.home() / "Library" / "Fonts"
         self.max_font_size_mb = 200  # 最大200MBまで
-        self.chunk_size = 8192  # 8KB
+        # 1MiB。8KBではf.readごとのPython/C境界のコストが支配的になる。
+        # mmapフォールバック時の読み込み単位と、mmapに切り替えるファイル
+        # サイズの閾値を兼ねる（これ未満は1回のreadで読み切る）
+        self.chunk_size = 1 << 20
         self.use_cache = use_cache
 
         # キャッシュの初期化
@@ -84,50 +116,48 @@ class FontManager:
             return self._scan_fonts_all(folder)
 
     def _scan_fonts_generator(self, folder: Path):
-        """フォントスキャンのジェネレータ版（内部使用）"""
+        """フォントスキャンのジェネレータ版（内部使用）
+
+        os.scandirベースの1回の走査で全拡張子をまとめて検出する。
+        拡張子ごとのrglobはディレクトリツリーを拡張子の数だけ歩き直すうえ、
+        パターンマッチのためにパスごとのstatも増える。
+        """
         fonts = []
         batch_size = 100  # 100ファイルごとにバッチ処理
 
-        # サブディレクトリも含めて再帰的に検索
-        for ext in self.font_extensions:
-            for font_path in folder.rglob(f"*{ext}"):
-                # .DS_Storeなどの隠しファイルを除外
-                if font_path.name.startswith("."):
-                    continue
-
-                # クラウドストレージの同期中ファイルを除外
-                if is_cloud_storage_syncing(font_path):
-                    continue
+        # 隠しファイルの除外はiter_font_files側で行われる
+        for font_path in iter_font_files(folder, self._font_extension_set):
+            # クラウドストレージの同期中ファイルを除外
+            if is_cloud_storage_syncing(font_path):
+                continue
 
-                fonts.append(font_path)
+            fonts.append(font_path)
 
-                # バッチ処理モードの場合
-                if len(fonts) >= batch_size:
-                    yield sorted(fonts)
-                    fonts = []
+            # バッチ処理モードの場合
+            # （バッチ内・バッチ間とも順序は保証しない。バッチごとのソートは
+            # バッチ内しか整列できず全体順序にならないため、コストだけ払って
+            # いた。順序が必要な呼び出し側は最後に一度ソートする）
+            if len(fonts) >= batch_size:
+                yield fonts
+                fonts = []
 
         # 残りのフォントをyield
         if fonts:
-            yield sorted(fonts)
+            yield fonts
 
     def _scan_fonts_all(self, folder: Path):
-        """全フォントスキャン（内部使用）"""
-        fonts = []
-
-        # サブディレクトリも含めて再帰的に検索
-        for ext in self.font_extensions:
-            for font_path in folder.rglob(f"*{ext}"):
-                # .DS_Storeなどの隠しファイルを除外
-                if font_path.name.startswith("."):
-                    continue
-
-                # クラウドストレージの同期中ファイルを除外
-                if is_cloud_storage_syncing(font_path):
-                    continue
+        """全フォントスキャン（内部使用）
 
-                fonts.append(font_path)
-
-        return sorted(fonts)
+        隠しファイルの除外も含め、os.scandirベースの1回の走査で検出する。
+        """
+        fonts = [
+            font_path
+            for font_path in iter_font_files(folder, self._font_extension_set)
+            if not is_cloud_storage_syncing(font_path)
+        ]
+        # in-placeソートでリストのコピーを1回分省く
+        fonts.sort()
+        return fonts
 
     @retry_on_error(max_retries=3, delay=0.5)
     def calculate_hash(self, file_path: Path, use_cache: Optional[bool] = None) -> str:
@@ -167,11 +197,43 @@ class FontManager:
                 )
 
         try:
+            # アルゴリズムはSHA-256に固定している。ハッシュ値はconfig.jsonに
+            # 保存され同期先のMac間で比較されるため、途中で変えると全フォントが
+            # 「要更新」と誤判定される。hashlib.sha256はOpenSSLのEVP実装に
+            # 委譲されるため、SHA-NIやARMv8暗号拡張などのハードウェア支援が
+            # 自動的に使われ、速度面の不利も実質ない
             sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                # 大きなファイルにも対応するため、チャンクごとに読み込む
-                for chunk in iter(lambda: f.read(self.chunk_size), b""):
-                    sha256_hash.update(chunk)
+                file_size = os.fstat(f.fileno()).st_size
+                _advise_sequential_read(f.fileno())
+                if file_size >= self.chunk_size:
+                    # ファイル全体をメモリマップし、C呼び出しでハッシュ計算する
+                    # （チャンクごとのPythonループとコピーを省ける）。
+                    # 巨大なファイルは16MBの窓に区切って渡し、OSの先読みが
+                    # 追いつく余地を残す（コピーは発生しない）
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            # 先頭から順に全部読むことをVM層にも伝える
+                            # （madviseは3.8以降だが環境により定数がない）
+                            if hasattr(mm, "madvise"):
+                                try:
+                                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                                    mm.madvise(mmap.MADV_WILLNEED)
+                                except (OSError, AttributeError):
+                                    pass
+                            if file_size > _MMAP_WINDOW_THRESHOLD:
+                                with memoryview(mm) as view:
+                                    for i in range(0, file_size, _MMAP_WINDOW_SIZE):
+                                        sha256_hash.update(view[i:i + _MMAP_WINDOW_SIZE])
+                            else:
+                                sha256_hash.update(mm)
+                    except (ValueError, OSError):
+                        # mmapできないファイルシステムなどではチャンク読み込みに戻る
+                        for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                            sha256_hash.update(chunk)
+                else:
+                    # 小さなファイルはmmapのセットアップコストの方が高い
+                    sha256_hash.update(f.read())
             hash_value = sha256_hash.hexdigest()
 
             # キャッシュに保存
@@ -198,7 +260,10 @@ class FontManager:
             PermissionError: コピー先への書き込み権限がない場合
             FontValidationError: フォントファイルが無効な場合
         """
-        if not src.exists():
+        # 存在確認とサイズ取得を1回のstatで済ませる
+        try:
+            src_stat = src.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"コピー元ファイルが存在しません: {src}")
 
         # 詳細な検証
@@ -229,7 +294,7 @@ class FontManager:
             dst = self.font_install_dir / safe_filename
 
         # ディスク容量チェック
-        file_size_mb = src.stat().st_size / (1024 * 1024)
+        file_size_mb = src_stat.st_size / (1024 * 1024)
         disk_info = check_disk_space(dst.parent, file_size_mb * 1.1)  # 10%の余裕を持つ
 
         if not disk_info["has_enough_space"]:
@@ -241,8 +306,10 @@ class FontManager:
         dst.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # メタデータも保持してコピー
-            shutil.copy2(src, dst)
+            # APFSならclonefileによるCoWクローン（サイズに依らずほぼ即時）、
+            # それ以外はOSのゼロコピー機構を使うcopyfileにフォールバックする。
+            # いずれも同一性判定に使うmtimeは保持される
+            copy_file_fast(src, dst)
             return dst
         except PermissionError as e:
             raise PermissionError(
@@ -270,6 +337,25 @@ class FontManager:
 
         return font_path.exists() or original_path.exists()
 
+    def snapshot_installed_names(self) -> frozenset:
+        """インストール先ディレクトリのファイル名一覧を取得
+
+        is_font_installedを多数のフォントに対して繰り返すと名前ごとに
+        2回のstatがかかるため、1回のscandirでスナップショットを取り、
+        呼び出し側でセット参照させる。
+
+        Returns:
+            frozenset: インストール先に存在するファイル名のセット
+        """
+        try:
+            with os.scandir(self.font_install_dir) as entries:
+                return frozenset(
+                    entry.name for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                )
+        except OSError:
+            return frozenset()
+
     def get_installed_font_path(self, font_name: str) -> Optional[Path]:
         """インストール済みフォントのパスを取得
 
@@ -327,16 +413,35 @@ class FontManager:
         except Exception as e:
             raise IOError(f"フォントの削除に失敗しました: {e}")
 
-    def get_font_info(self, font_path: Path) -> Dict[str, any]:
+    def get_font_info(self, font_path: Path, use_cache: Optional[bool] = None) -> Dict[str, any]:
         """フォントファイルの情報を取得（エラーハンドリング強化）
 
         Args:
             font_path (Path): フォントファイルのパス
+            use_cache (Optional[bool]): キャッシュを使用するか（Noneの場合はインスタンスの設定に従う）
 
         Returns:
             Dict[str, any]: フォントの情報（名前、サイズ、更新日時など）
         """
-        if not font_path.exists():
+        use_cache = self.use_cache if use_cache is None else use_cache
+
+        # キャッシュから取得を試みる（キーにサイズ+mtimeを含むため、
+        # ファイルが変更されていれば自動的にミスする）
+        if use_cache and self.cache:
+            cached_info = self.cache.get_info(font_path)
+            if cached_info is not None:
+                # ロック・同期状態はファイル内容が変わらなくても変化する
+                # （＝キャッシュキーが変わらない）ため、ヒット時も毎回
+                # 取り直す。コストはopen1回とマーカーチェックのみ
+                cached_info["is_locked"] = is_file_locked(font_path)
+                cached_info["is_syncing"] = is_cloud_storage_syncing(font_path)
+                return cached_info
+
+        # 存在確認とメタデータ取得を1回のstatで済ませる
+        # （exists()も内部でstatを呼ぶため、別に呼ぶと2倍のsyscallになる）
+        try:
+            stat = font_path.stat()
+        except FileNotFoundError:
             # エラー情報を含む辞書を返す
             return {
                 "name": font_path.name,
@@ -347,10 +452,18 @@ class FontManager:
                 "hash": None,
                 "error": f"フォントファイルが存在しません: {font_path}"
             }
+        except OSError as e:
+            return {
+                "name": font_path.name,
+                "path": str(font_path),
+                "size": 0,
+                "size_mb": 0,
+                "modified": 0,
+                "hash": None,
+                "error": str(e)
+            }
 
         try:
-            stat = font_path.stat()
-
             # 基本情報
             info = {
                 "name": font_path.name,
@@ -358,15 +471,22 @@ class FontManager:
                 "size": stat.st_size,
                 "size_mb": round(stat.st_size / (1024 * 1024), 2),
                 "modified": stat.st_mtime,
-                "hash": None,  # 必要に応じて後で計算
-                "is_locked": is_file_locked(font_path),
-                "is_syncing": is_cloud_storage_syncing(font_path)
+                "hash": None  # 必要に応じて後で計算
             }
 
             # サイズ警告
             if info["size_mb"] > self.max_font_size_mb:
                 info["warning"] = f"ファイルサイズが大きすぎます ({info['size_mb']}MB)"
 
+            # 安定した情報だけをキャッシュに保存する。揮発性のロック・
+            # 同期状態を含めると、ロック解除後もTTLいっぱい「ロック中」が
+            # 返り続け、probe_fontがそのフォントを同期対象から外してしまう
+            if use_cache and self.cache:
+                self.cache.set_info(font_path, info)
+
+            info["is_locked"] = is_file_locked(font_path)
+            info["is_syncing"] = is_cloud_storage_syncing(font_path)
+
             return info
 
         except Exception as e:
@@ -406,8 +526,9 @@ class FontManager:
         if not font_path.is_file():
             return False
 
-        # 拡張子チェック（大文字小文字を考慮）
-        if font_path.suffix.lower() not in [ext.lower() for ext in self.font_extensions]:
+        # 拡張子チェック（大文字小文字を考慮。frozensetへのO(1)参照で、
+        # 呼び出しごとの小文字化リスト再構築を避ける）
+        if font_path.suffix.lower() not in self._font_extension_set:
             return False
 
         # ファイルサイズチェック（0バイトでないこと）
@@ -422,16 +543,20 @@ class FontManager:
         Args:
             font_paths: フォントファイルパスのリスト
 
+        statやロック確認などのI/O待ちをスレッドで重ねる。executor.mapは
+        入力順のまま結果を返すため、呼び出し側から見える順序は逐次版と
+        変わらない。get_font_infoは例外を送出せず、失敗時は"error"キー
+        付きの辞書を返すため、ここで個別にtry/exceptを張る必要はない。
+
         Yields:
             Dict[str, any]: 各フォントの情報
         """
-        for font_path in font_paths:
-            try:
+        if len(font_paths) <= 1:
+            for font_path in font_paths:
                 yield self.get_font_info(font_path)
-            except Exception as e:
-                # エラーが発生してもスキップして続行
-                yield {
-                    "name": font_path.name,
-                    "path": str(font_path),
-                    "error": str(e)
-                }
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(font_paths))
+        ) as executor:
+            yield from executor.map(self.get_font_info, font_paths)
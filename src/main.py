@@ -1,16 +1,31 @@
 """font-sync CLIアプリケーションのエントリーポイント"""
 
-from typing import Optional
-
-import typer
-from rich.console import Console
+import sys
 
 # バージョン情報をインポート
 from . import __version__
 
+# --version はtyper/richを読み込む前に処理して即終了する。CLIの起動時間は
+# ほぼimportコストなので、バージョン表示だけのためにフレームワーク一式を
+# 読み込まない。エントリポイントがapp(モジュール属性)のため、importより
+# 前に割り込める場所はここしかない。font-sync以外のプロセス（pytest -v等）
+# からimportされた場合に誤発動しないようargv[0]も確認する
+if (
+    len(sys.argv) == 2
+    and sys.argv[1] in ("-v", "--version")
+    and sys.argv[0].endswith("font-sync")
+):
+    print(f"font-sync version {__version__}")
+    raise SystemExit(0)
+
+from functools import lru_cache  # noqa: E402
+from typing import Optional  # noqa: E402
+
+import typer  # noqa: E402
+
 # コマンドモジュールのインポート（後で追加）
 # from .commands import init, sync, list_fonts, import_fonts, clean
-from .utils import FontSyncError
+from .utils import FontSyncError  # noqa: E402
 
 # Typerアプリケーションの作成
 app = typer.Typer(
@@ -19,14 +34,22 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Richコンソールの作成（美しい出力用）
-console = Console()
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Richコンソールを遅延生成して返す（美しい出力用）
+
+    richのimportはCLI起動コストの中で大きいため、実際に出力するまで
+    読み込みを遅らせる。
+    """
+    from rich.console import Console
+    return Console()
 
 
 def version_callback(value: bool) -> None:
     """バージョン情報を表示するコールバック"""
     if value:
-        console.print(f"font-sync version {__version__}")
+        _get_console().print(f"font-sync version {__version__}")
         raise typer.Exit()
 
 
@@ -209,6 +232,7 @@ def clean(
 def handle_errors(func):
     """共通エラーハンドリングデコレータ"""
     def wrapper(*args, **kwargs):
+        console = _get_console()
         try:
             return func(*args, **kwargs)
         except typer.Exit:
@@ -251,10 +275,6 @@ from .commands.lock_cmd import lock_app  # noqa: E402
 app.add_typer(lock_app, name="lock", help="fontops.lock の管理")
 
 
-# apply コマンドを登録（handle_errors 定義後にインポートして循環参照を回避）
-from .commands.apply import apply_command as _apply_command  # noqa: E402
-
-
 @app.command("apply", help="fontops.lock に基づいてフォント環境の状態を確認します")
 def apply_cmd(
     resolve: bool = typer.Option(
@@ -274,7 +294,10 @@ def apply_cmd(
     ),
 ) -> None:
     """fontops.lock に基づいてフォント環境の状態を確認します。"""
-    _apply_command(resolve=resolve, dry_run=dry_run, json_output=json_output)
+    # 他のコマンドと同様に遅延インポートする（resolver経由でhttpx等の重い
+    # 依存を引き込むため、apply実行時以外は起動コストに含めない）
+    from .commands.apply import apply_command
+    apply_command(resolve=resolve, dry_run=dry_run, json_output=json_output)
 
 
 if __name__ == "__main__":
@@ -36,6 +36,32 @@ class ParallelProcessor:
             config: 並列処理の設定
         """
         self.config = config or ParallelConfig()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """スレッドプールを遅延生成して返す
+
+        呼び出しのたびにプールを作り直すとワーカースレッドの起動コストが
+        毎回かかるため、最初のprocess_batchで作ったプールをインスタンスに
+        保持して使い回す。
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.config.max_workers
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """保持しているスレッドプールを終了する"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ParallelProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
 
     def process_batch(
         self,
@@ -46,6 +72,13 @@ class ParallelProcessor:
     ) -> List[Tuple[bool, Any]]:
         """アイテムをバッチで並列処理
 
+        以前はchunk_sizeごとにタスクを投入し、そのチャンクが全件完了する
+        まで次を投入しなかったため、チャンク末尾の遅いタスク1つで全ワーカー
+        が待たされていた。現在は完了するたびに次のアイテムを補充する
+        スライディングウィンドウ方式で、ファイルサイズにばらつきがあっても
+        全ワーカーが途切れず稼働する。同時投入数はmax_workersの2倍に
+        抑えるため、アイテム数が多くても投入済みFutureが溜まらない。
+
         Args:
             items: 処理対象のアイテムリスト
             process_func: 各アイテムを処理する関数
@@ -54,43 +87,76 @@ class ParallelProcessor:
 
         Returns:
             List[Tuple[bool, Any]]: (成功フラグ, 結果)のリスト
+
+        Raises:
+            concurrent.futures.TimeoutError: timeout設定時間内に1件も
+                完了しなかった場合
         """
         results = []
         completed = 0
         total = len(items)
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.config.max_workers
-        ) as executor:
-            # バッチごとに処理
-            for i in range(0, total, self.config.chunk_size):
-                batch = items[i:i + self.config.chunk_size]
-
-                # 並列でタスクを送信
-                future_to_item = {
-                    executor.submit(process_func, item): item
-                    for item in batch
-                }
-
-                # 結果を収集
-                for future in concurrent.futures.as_completed(
-                    future_to_item,
-                    timeout=self.config.timeout
-                ):
-                    item = future_to_item[future]
-                    try:
-                        result = future.result()
-                        results.append((True, result))
-                    except Exception as e:
-                        if error_handler:
-                            fallback_result = error_handler(item, e)
-                            results.append((False, fallback_result))
-                        else:
-                            results.append((False, {"error": str(e), "item": item}))
-
-                    completed += 1
-                    if progress_callback:
+        window = self.config.max_workers * 2
+
+        # 進捗コールバックの間引き幅。数千件の処理で毎回Richの再描画まで
+        # 走らせるとコールバック側がCPUを支配するため、およそ1%刻み
+        # （または50msごと）に抑える。100件未満ではstep=1となり従来どおり
+        # 全件通知される
+        progress_step = max(1, total // 100)
+        last_emit = time.monotonic()
+
+        executor = self._get_executor()
+        item_iter = iter(items)
+        future_to_item: Dict[concurrent.futures.Future, Any] = {}
+
+        def submit_next() -> bool:
+            try:
+                item = next(item_iter)
+            except StopIteration:
+                return False
+            future_to_item[executor.submit(process_func, item)] = item
+            return True
+
+        # ウィンドウ分だけ先行投入する
+        while len(future_to_item) < window and submit_next():
+            pass
+
+        while future_to_item:
+            done, _ = concurrent.futures.wait(
+                future_to_item,
+                timeout=self.config.timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if not done:
+                raise concurrent.futures.TimeoutError(
+                    f"{len(future_to_item)} tasks did not complete "
+                    f"within {self.config.timeout} seconds"
+                )
+
+            for future in done:
+                item = future_to_item.pop(future)
+                try:
+                    result = future.result()
+                    results.append((True, result))
+                except Exception as e:
+                    if error_handler:
+                        fallback_result = error_handler(item, e)
+                        results.append((False, fallback_result))
+                    else:
+                        results.append((False, {"error": str(e), "item": item}))
+
+                completed += 1
+                if progress_callback:
+                    now = time.monotonic()
+                    if (
+                        completed % progress_step == 0
+                        or completed == total
+                        or now - last_emit > 0.05
+                    ):
                         progress_callback(completed, total)
+                        last_emit = now
+
+                # 完了した分だけ次のアイテムを補充する
+                submit_next()
 
         return results
 
@@ -102,6 +168,11 @@ class ParallelProcessor:
     ) -> Dict[Path, Optional[str]]:
         """複数ファイルのハッシュを並列計算
 
+        ハッシュ計算は意図的にスレッドプールで行う。hashlibはダイジェスト
+        更新中にGILを解放するため（特にmmapで1回のupdateに渡す場合）、
+        スレッドでもコアを並列に使える。プロセスプールはspawnとpickleの
+        オーバーヘッドが載るだけで、この用途では利点がない。
+
         Args:
             font_paths: フォントファイルパスのリスト
             hash_func: ハッシュ計算関数
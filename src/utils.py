@@ -3,15 +3,116 @@
 エッジケース処理、リトライ機構、ファイル検証などを提供します。
 """
 
+import ctypes
+import ctypes.util
 import errno
 import os
+import random
+import shutil
+import sys
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 
 T = TypeVar('T')
 
+# macOS（APFS）ではclonefile(2)でcopy-on-writeクローンが作れる。
+# データブロックを共有するためファイルサイズに関係なくほぼ一瞬で完了する
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        _clonefile = _libc.clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+        _clonefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
+
+
+def copy_file_fast(src: Path, dst: Path) -> None:
+    """ファイルをできるだけ安価にコピーする
+
+    APFS上のmacOSではclonefileによるcopy-on-writeクローンを試み、
+    使えない場合（別ボリューム間、非APFS、macOS以外）はOSのゼロコピー機構を
+    使うshutil.copyfileにフォールバックします。どちらの経路でも同一性判定に
+    使うmtimeは保持されます。
+
+    Args:
+        src: コピー元ファイル
+        dst: コピー先ファイル
+    """
+    if _clonefile is not None:
+        # clonefileはコピー先が存在するとEEXISTで失敗するため先に削除する
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            # クローンはタイムスタンプも含めて複製される
+            return
+
+    shutil.copyfile(src, dst)
+    src_stat = os.stat(src)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+# 対応するフォント拡張子（小文字で比較する）
+FONT_EXTENSIONS = frozenset({'.otf', '.ttf'})
+
+# ファイル名として使えない文字と、それを'_'に置き換える変換テーブル。
+# 文字ごとのstr.replaceを繰り返すより、str.translateの1パスで済ませる
+_INVALID_CHARS = frozenset('/\\:*?"<>|')
+_SAFE_TRANS = str.maketrans({c: '_' for c in _INVALID_CHARS})
+
+# クラウドストレージの同期中を示すファイル名の末尾パターン
+_SYNC_SUFFIXES = frozenset({'.icloud', '.tmp', '.download', '.partial'})
+
+# OTF/TTFの先頭4バイトのマジックナンバー。すべてちょうど4バイトなので、
+# startswithを繰り返す代わりにfrozensetへの1回の参照で判定できる
+# （4バイト未満しか読めなかった場合も自然に不一致になる）
+_FONT_MAGICS = frozenset({
+    b'OTTO',  # OTF
+    b'\x00\x01\x00\x00',  # TTF
+    b'true',  # TTF
+    b'typ1',  # TTF
+})
+
+
+def iter_font_files(folder: Path, extensions: Optional[frozenset] = None) -> Iterator[Path]:
+    """フォルダ内のフォントファイルを再帰的に列挙する
+
+    拡張子ごとにrglobを繰り返すとディレクトリを複数回走査することになるため、
+    os.scandirによる1回の走査で全拡張子をまとめて判定します。
+
+    Args:
+        folder: 走査対象のフォルダ
+        extensions: 対象とする拡張子のセット（小文字）。Noneの場合はFONT_EXTENSIONS
+
+    Yields:
+        Path: フォントファイルのパス（隠しファイルは除外）
+    """
+    if extensions is None:
+        extensions = FONT_EXTENSIONS
+
+    stack = [str(folder)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        dot = name.rfind('.')
+                        if dot != -1 and name[dot:].lower() in extensions:
+                            yield Path(entry.path)
+        except OSError:
+            # 読み取れないディレクトリはスキップ
+            continue
+
 
 class FontSyncError(Exception):
     """font-sync固有のエラー基底クラス"""
@@ -39,21 +140,34 @@ def retry_on_error(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (IOError, OSError, FileLockedError)
+    exceptions: tuple = (IOError, OSError, FileLockedError),
+    max_delay: float = 30.0,
+    jitter: bool = True
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """エラー時にリトライするデコレータ
 
+    待機時間にはランダムなゆらぎ（0.5〜1.5倍）を加える。並列処理中に
+    複数のワーカーが同じロック済みファイルで失敗すると、決定的な
+    バックオフでは全員が同時に再試行して再び衝突するため。
+
     Args:
         max_retries: 最大リトライ回数
         delay: 初回リトライまでの待機時間（秒）
         backoff: リトライごとの待機時間倍率
         exceptions: リトライ対象の例外
+        max_delay: 待機時間の上限（秒）
+        jitter: 待機時間にゆらぎを加えるか
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # バックオフのスケジュールはデコレート時に一度だけ計算する。
+        # リトライループ内での乗算とmin()がタプル参照1回になる
+        schedule = tuple(
+            min(delay * (backoff ** i), max_delay) for i in range(max_retries)
+        )
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
-            current_delay = delay
 
             for attempt in range(max_retries + 1):
                 try:
@@ -61,8 +175,10 @@ def retry_on_error(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        sleep_for = schedule[attempt]
+                        if jitter:
+                            sleep_for *= random.uniform(0.5, 1.5)
+                        time.sleep(sleep_for)
                     else:
                         raise
 
@@ -83,14 +199,16 @@ def is_file_locked(file_path: Path) -> bool:
     Returns:
         ロックされている場合True
     """
-    if not file_path.exists():
-        return False
-
     try:
-        # ファイルを読み取り専用で開けるか確認
+        # ファイルを読み取り専用で開けるか確認。事前のexists()は行わず、
+        # 存在しない場合もopenの結果（FileNotFoundError）で判定して
+        # syscallを1回に抑える。書き込みを試すプローブと違い、
+        # 状態を一切変更しない
         with open(file_path, 'rb'):
             pass
         return False
+    except FileNotFoundError:
+        return False
     except IOError as e:
         if e.errno in (errno.EACCES, errno.EPERM, errno.EBUSY):
             return True
@@ -107,9 +225,10 @@ def wait_for_file_unlock(file_path: Path, timeout: int = 30) -> bool:
     Returns:
         ロックが解除された場合True、タイムアウトした場合False
     """
-    start_time = time.time()
+    # NTP補正などで壁時計が飛んでもタイムアウトが狂わないようmonotonicで測る
+    start_time = time.monotonic()
 
-    while time.time() - start_time < timeout:
+    while time.monotonic() - start_time < timeout:
         if not is_file_locked(file_path):
             return True
         time.sleep(0.5)
@@ -136,30 +255,46 @@ def validate_font_file_advanced(file_path: Path) -> Dict[str, Any]:
         "is_locked": False
     }
 
-    # ファイルの存在確認
-    if not file_path.exists():
+    # 存在確認・ファイル種別・ロック状態・サイズ・ヘッダーを1回のopenと
+    # fstatでまとめて判定する。exists()/is_file()/stat()/is_file_locked()を
+    # 個別に呼ぶと1ファイルあたり5回以上のsyscallになるが、openの失敗理由が
+    # 同じ情報を持っている
+    header = None
+    try:
+        with open(file_path, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+            try:
+                header = f.read(4)
+            except OSError:
+                result["warnings"].append("ファイルヘッダーの読み取りに失敗しました")
+    except FileNotFoundError:
         raise FontValidationError(
             f"フォントファイルが存在しません: {file_path}",
             hint="ファイルパスを確認してください"
         )
-
-    # ファイルかどうか確認
-    if not file_path.is_file():
+    except IsADirectoryError:
         raise FontValidationError(
             f"指定されたパスはファイルではありません: {file_path}",
             hint="ディレクトリではなくファイルを指定してください"
         )
+    except PermissionError:
+        # openできた場合はロックされていないことの証明になるため、
+        # 個別のis_file_locked()呼び出しは不要。失敗時のみロック扱いにする
+        result["is_locked"] = True
+        result["warnings"].append("ファイルが他のアプリケーションで使用中です")
+        stat_result = file_path.stat()
 
-    # 拡張子チェック
-    valid_extensions = ('.otf', '.ttf', '.OTF', '.TTF')
-    if file_path.suffix not in valid_extensions:
+    # 拡張子チェック（openの後に行うことで、ディレクトリ指定時は
+    # 拡張子エラーではなく「ファイルではありません」を返せる）。
+    # 小文字化してから比較するため.Otfのような混在ケースも受け付ける
+    if file_path.suffix.lower() not in FONT_EXTENSIONS:
         raise FontValidationError(
             f"サポートされていないファイル形式です: {file_path.suffix}",
             hint="対応形式: .otf, .ttf"
         )
 
     # ファイルサイズチェック
-    file_size = file_path.stat().st_size
+    file_size = stat_result.st_size
     file_size_mb = file_size / (1024 * 1024)
     result["file_size_mb"] = round(file_size_mb, 2)
 
@@ -173,59 +308,37 @@ def validate_font_file_advanced(file_path: Path) -> Dict[str, Any]:
         result["warnings"].append(f"ファイルサイズが大きすぎます ({file_size_mb:.1f}MB)")
         result["valid"] = True  # 警告のみ、エラーにはしない
 
-    # ファイル名の検証
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
+    # ファイル名の検証（frozensetのisdisjointはC実装の1パスで済む）
     filename = file_path.name
-    if any(char in filename for char in invalid_chars):
+    if not _INVALID_CHARS.isdisjoint(filename):
         raise FontValidationError(
             f"ファイル名に無効な文字が含まれています: {filename}",
             hint="ファイル名から特殊文字を取り除いてください"
         )
 
-    # ファイルロックチェック
-    if is_file_locked(file_path):
-        result["is_locked"] = True
-        result["warnings"].append("ファイルが他のアプリケーションで使用中です")
-
     # 基本的なバイナリチェック（フォント形式の簡易検証）
-    try:
-        with open(file_path, 'rb') as f:
-            header = f.read(4)
-
-            # OTF/TTFの基本的なマジックナンバーチェック
-            valid_headers = [
-                b'OTTO',  # OTF
-                b'\x00\x01\x00\x00',  # TTF
-                b'true',  # TTF
-                b'typ1',  # TTF
-            ]
-
-            if not any(header.startswith(h) for h in valid_headers):
-                result["warnings"].append("フォントファイルの形式が不明です")
-    except Exception:
-        result["warnings"].append("ファイルヘッダーの読み取りに失敗しました")
+    if header is not None and header not in _FONT_MAGICS:
+        result["warnings"].append("フォントファイルの形式が不明です")
 
     return result
 
 
+@lru_cache(maxsize=4096)
 def get_safe_filename(filename: str) -> str:
     """安全なファイル名に変換
 
+    純粋関数（同じ入力には常に同じ出力）なのでメモ化している。
+    syncやlistではフォントごとに複数箇所から同じ名前で呼ばれるため、
+    2回目以降は置換処理を省略できる。
+
     Args:
         filename: 元のファイル名
 
     Returns:
         安全なファイル名
     """
-    # 無効な文字を置換
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    safe_name = filename
-
-    for char in invalid_chars:
-        safe_name = safe_name.replace(char, '_')
-
-    # 先頭・末尾の空白とドットを削除
-    safe_name = safe_name.strip('. ')
+    # 無効な文字を置換し、先頭・末尾の空白とドットを削除
+    safe_name = filename.translate(_SAFE_TRANS).strip('. ')
 
     # 空になった場合はデフォルト名を使用
     if not safe_name:
@@ -234,6 +347,19 @@ def get_safe_filename(filename: str) -> str:
     return safe_name
 
 
+@lru_cache(maxsize=32)
+def _disk_usage_cached(path_str: str, time_bucket: int):
+    """disk_usageの結果を2秒のタイムバケット付きでキャッシュする
+
+    並列コピー中はフォントごとに容量チェックが走るため、同じボリュームへの
+    問い合わせを2秒間は再利用する。time_bucketはtime.monotonic()//2で、
+    バケットが変わると自動的にキャッシュミスになり最新値を取り直す。
+    shutil.disk_usageはPOSIXではstatvfs相当だが、total/used/freeを
+    計算済みのバイト数で返すためこちらを使う（Windowsでも動く）。
+    """
+    return shutil.disk_usage(path_str)
+
+
 def check_disk_space(path: Path, required_mb: float) -> Dict[str, Any]:
     """ディスク容量をチェック
 
@@ -245,10 +371,10 @@ def check_disk_space(path: Path, required_mb: float) -> Dict[str, Any]:
         容量情報の辞書
     """
     try:
-        stat = os.statvfs(path)
-        free_mb = (stat.f_bavail * stat.f_frsize) / (1024 * 1024)
-        total_mb = (stat.f_blocks * stat.f_frsize) / (1024 * 1024)
-        used_percent = ((total_mb - free_mb) / total_mb) * 100
+        usage = _disk_usage_cached(str(path), int(time.monotonic() // 2))
+        free_mb = usage.free / (1024 * 1024)
+        total_mb = usage.total / (1024 * 1024)
+        used_percent = (usage.used / usage.total) * 100
 
         return {
             "free_mb": round(free_mb, 2),
@@ -266,6 +392,20 @@ def check_disk_space(path: Path, required_mb: float) -> Dict[str, Any]:
         }
 
 
+@lru_cache(maxsize=256)
+def _has_dropbox_attrs(parent_str: str) -> bool:
+    """親ディレクトリにDropboxのマーカーファイルがあるかチェック
+
+    スキャン中は同じディレクトリ内のフォントごとに呼ばれるため、
+    ディレクトリ単位でキャッシュして1フォルダあたり2回のstatに抑える。
+    マーカーの有無は1回の実行中に変わらないのでTTLは不要。
+    """
+    return any(
+        os.path.exists(os.path.join(parent_str, attr))
+        for attr in ('.dropbox.attr', '.dropbox')
+    )
+
+
 def is_cloud_storage_syncing(path: Path) -> bool:
     """クラウドストレージが同期中かチェック
 
@@ -276,52 +416,98 @@ def is_cloud_storage_syncing(path: Path) -> bool:
         同期中の場合True
     """
     # Dropboxの同期チェック
-    dropbox_attrs = ['.dropbox.attr', '.dropbox']
-    for attr in dropbox_attrs:
-        if (path.parent / attr).exists():
-            # より詳細なチェックは実装が複雑なため、簡易的に判断
-            return False
-
-    # iCloud Driveの同期チェック
-    if '.icloud' in str(path):
-        return True
+    if _has_dropbox_attrs(str(path.parent)):
+        # より詳細なチェックは実装が複雑なため、簡易的に判断
+        return False
 
-    # 一般的な同期中を示すファイル名パターン
-    sync_indicators = ['.tmp', '.download', '.partial', '~']
-    return any(str(path).endswith(ind) for ind in sync_indicators)
+    # iCloudのプレースホルダと一般的な同期中ファイルのパターン。
+    # str(path)を作って部分一致で走査する代わりに、PurePathが保持する
+    # suffix/partsに対するセット参照1回で判定する
+    return (
+        path.suffix.lower() in _SYNC_SUFFIXES
+        or path.name.endswith('~')
+        or '.icloud' in path.parts
+    )
 
 
 def batch_process(
     items: List[Any],
     process_func: Callable[[Any], Any],
     batch_size: int = 50,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_workers: Optional[int] = None,
+    precheck: Optional[Callable[[Any], bool]] = None
 ) -> List[Any]:
     """大量のアイテムをバッチ処理
 
+    検証・ハッシュ計算・コピーなど、ここを通る処理はI/O待ちが支配的で
+    open/read/statの間はGILが解放されるため、バッチ内はスレッドプールで
+    並列実行する。結果と進捗コールバックは投入順に返すため、呼び出し側
+    から見た挙動は逐次版と同じ。
+
+    precheckを渡すと、失敗が分かりきったアイテム（拡張子違い、同期中の
+    ファイルなど）をprocess_funcに渡さず即エラー扱いにする。例外の送出と
+    捕捉よりも安価で、ワーカースレッドも消費しない。
+
     Args:
         items: 処理対象のアイテムリスト
         process_func: 各アイテムを処理する関数
         batch_size: バッチサイズ
         progress_callback: 進捗コールバック (current, total)
+        max_workers: ワーカースレッド数（1で逐次実行、Noneで自動）
+        precheck: Falseを返したアイテムを処理せずエラーにする述語
 
     Returns:
-        処理結果のリスト
+        処理結果のリスト（入力と同じ順序）
     """
-    results = []
     total = len(items)
+    # 事前に全要素分を確保し、appendの再確保を避けてインデックス代入する
+    results: List[Any] = [None] * total
+    # コールバック有無の判定はループの外で1回だけ行う
+    has_cb = progress_callback is not None
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+
+    # ワーカー1つ分の仕事しかない場合はスレッドを立てない
+    if max_workers == 1 or total <= 1:
+        for idx, item in enumerate(items):
+            if precheck is not None and not precheck(item):
+                results[idx] = {"error": "事前チェックに失敗しました", "item": item}
+            else:
+                try:
+                    results[idx] = process_func(item)
+                except Exception as e:
+                    results[idx] = {"error": str(e), "item": item}
 
-    for i in range(0, total, batch_size):
-        batch = items[i:i + batch_size]
+            if has_cb:
+                progress_callback(idx + 1, total)
 
-        for idx, item in enumerate(batch):
-            try:
-                result = process_func(item)
-                results.append(result)
-            except Exception as e:
-                results.append({"error": str(e), "item": item})
+        return results
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i in range(0, total, batch_size):
+            batch = items[i:i + batch_size]
+            # precheckに落ちたアイテムはスレッドに投入しない（futureはNone）
+            futures = [
+                None if precheck is not None and not precheck(item)
+                else executor.submit(process_func, item)
+                for item in batch
+            ]
 
-            if progress_callback:
-                progress_callback(i + idx + 1, total)
+            # as_completedではなく投入順に回収することで結果の順序を保つ
+            for idx, (item, future) in enumerate(zip(batch, futures)):
+                if future is None:
+                    results[i + idx] = {"error": "事前チェックに失敗しました", "item": item}
+                else:
+                    try:
+                        results[i + idx] = future.result()
+                    except Exception as e:
+                        results[i + idx] = {"error": str(e), "item": item}
+
+                if has_cb:
+                    progress_callback(i + idx + 1, total)
 
     return results
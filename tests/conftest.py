@@ -1,24 +1,23 @@
 """pytest設定と共通フィクスチャ"""
 
 import json
-import shutil
-import tempfile
 from pathlib import Path
-from typing import Generator
 
 import pytest
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """一時ディレクトリを作成するフィクスチャ
 
-    Yields:
+    pytest組み込みのtmp_pathに委譲する。mkdtemp+rmtreeを自前で行うより
+    syscallが少なく、後始末もpytestがまとめて行う（直近数回分は
+    デバッグ用に残る）。
+
+    Returns:
         Path: 一時ディレクトリのパス
     """
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -104,6 +103,26 @@ def sample_config(mock_config_dir: Path, mock_sync_folder: Path) -> Path:
     return config_file
 
 
+@pytest.fixture
+def installed_font_manager(mock_font_install_dir: Path):
+    """インストール先をモックに差し替えたFontManagerを作成
+
+    各テストでFontManager生成とfont_install_dirのmonkeypatchを
+    繰り返す代わりに、差し替え済みのインスタンスを提供する。
+
+    Args:
+        mock_font_install_dir: モックのインストール先
+
+    Returns:
+        FontManager: インストール先差し替え済みのインスタンス
+    """
+    from src.font_manager import FontManager
+
+    font_manager = FontManager()
+    font_manager.font_install_dir = mock_font_install_dir
+    return font_manager
+
+
 @pytest.fixture
 def mock_home_dir(monkeypatch, temp_dir: Path) -> Path:
     """ホームディレクトリをモック
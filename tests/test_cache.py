@@ -1,6 +1,5 @@
 """キャッシュ機能のテスト"""
 
-import json
 import time
 from pathlib import Path
 
@@ -26,8 +25,7 @@ class TestFontCache:
         assert cache.cache_dir == cache_dir
         assert cache.ttl_hours == 24
         assert cache_dir.exists()
-        assert cache.hash_cache_file == cache_dir / "hash_cache.json"
-        assert cache.info_cache_file == cache_dir / "info_cache.json"
+        assert cache.cache_db_file == cache_dir / "cache.sqlite"
 
     def test_default_cache_dir(self):
         """デフォルトキャッシュディレクトリのテスト"""
@@ -43,7 +41,7 @@ class TestFontCache:
 
         key1 = cache._get_cache_key(test_file)
         assert isinstance(key1, str)
-        assert len(key1) == 32  # MD5ハッシュの長さ
+        assert len(key1) == 32  # BLAKE2b（128bit）の16進数表現の長さ
 
         # 同じファイルは同じキー
         key2 = cache._get_cache_key(test_file)
@@ -74,14 +72,17 @@ class TestFontCache:
         # キャッシュから取得
         assert cache.get_hash(test_file) == test_hash
 
-        # メモリキャッシュとファイルキャッシュの両方を確認
+        # メモリキャッシュとDBキャッシュの両方を確認
         cache_key = cache._get_cache_key(test_file)
         assert cache_key in cache._memory_cache
 
-        # ファイルキャッシュも確認
-        with open(cache.hash_cache_file, 'r') as f:
-            file_cache = json.load(f)
-            assert cache_key in file_cache
+        # DBキャッシュも確認（バッファをflushしてから参照する）
+        cache.flush()
+        row = cache._conn.execute(
+            "SELECT hash FROM fontcache WHERE key = ?", (cache_key,)
+        ).fetchone()
+        assert row is not None
+        assert row[0] == test_hash
 
     def test_info_cache(self, cache: FontCache, temp_dir: Path):
         """情報キャッシュのテスト"""
@@ -115,8 +116,8 @@ class TestFontCache:
         cache.set_hash(test_file, "test_hash")
         assert cache.get_hash(test_file) == "test_hash"
 
-        # 4秒待機
-        time.sleep(4)
+        # 実際に待つ代わりに時刻源を4秒進める
+        cache._now = lambda: time.time() + 4
 
         # キャッシュが期限切れ
         assert cache.get_hash(test_file) is None
@@ -142,8 +143,7 @@ class TestFontCache:
         assert cache.get_hash(test_file) is None
         assert cache.get_info(test_file) is None
         assert len(cache._memory_cache) == 0
-        assert not cache.hash_cache_file.exists()
-        assert not cache.info_cache_file.exists()
+        assert cache._conn.execute("SELECT COUNT(*) FROM fontcache").fetchone()[0] == 0
 
     def test_cleanup_expired(self, temp_dir: Path):
         """期限切れエントリのクリーンアップテスト"""
@@ -158,13 +158,13 @@ class TestFontCache:
             cache.set_hash(file, f"hash{i}")
 
         # 一部のエントリを期限切れにする（直接タイムスタンプを変更）
-        hash_cache = cache._load_cache_file(cache.hash_cache_file)
-        expired_keys = []
-        for i, (key, entry) in enumerate(list(hash_cache.items())):
-            if i < 2:  # 最初の2つを期限切れに
-                entry['timestamp'] = time.time() - (25 * 3600)  # 25時間前
-                expired_keys.append(key)
-        cache._save_cache_file(cache.hash_cache_file, hash_cache)
+        cache.flush()
+        expired_ts = time.time() - (25 * 3600)  # 25時間前
+        for file in files[:2]:  # 最初の2つを期限切れに
+            key = cache._get_cache_key(file)
+            cache._conn.execute(
+                "UPDATE fontcache SET ts = ? WHERE key = ?", (expired_ts, key)
+            )
 
         # メモリキャッシュもクリア（再読み込みを強制）
         cache._memory_cache.clear()
@@ -203,17 +203,39 @@ class TestFontCache:
         assert stats['hash_entries'] == 3
         assert stats['info_entries'] == 2
         assert stats['memory_entries'] == 3  # ハッシュのみメモリキャッシュに
-        assert stats['hash_cache_size'] > 0
-        assert stats['info_cache_size'] > 0
+        assert stats['cache_db_size'] > 0
 
-    def test_invalid_cache_file(self, cache: FontCache):
-        """無効なキャッシュファイルの処理テスト"""
-        # 無効なJSONを書き込む
-        cache.hash_cache_file.write_text("invalid json{")
+    def test_memory_cache_lru_bound(self, cache: FontCache, temp_dir: Path):
+        """メモリキャッシュの上限（LRU）テスト"""
+        cache._memory_cache_max_entries = 3
 
-        # エラーが発生せず、空のキャッシュが返される
-        result = cache._load_cache_file(cache.hash_cache_file)
-        assert result == {}
+        files = []
+        for i in range(5):
+            file = temp_dir / f"font{i}.otf"
+            file.write_bytes(b"data")
+            files.append(file)
+            cache.set_hash(file, f"hash{i}")
+
+        # 上限を超えた分は古い順に追い出される
+        assert len(cache._memory_cache) == 3
+
+        # 追い出されたエントリもDB経由で取得できる
+        assert cache.get_hash(files[0]) == "hash0"
+
+    def test_corrupted_cache_db(self, temp_dir: Path):
+        """破損したキャッシュDBの処理テスト"""
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        # SQLiteとして無効なデータを書き込む
+        (cache_dir / "cache.sqlite").write_bytes(b"not a sqlite database")
+
+        # エラーが発生せず、DBが作り直される
+        cache = FontCache(cache_dir=cache_dir, ttl_hours=1)
+
+        test_file = temp_dir / "font.otf"
+        test_file.write_bytes(b"font data")
+        cache.set_hash(test_file, "test_hash")
+        assert cache.get_hash(test_file) == "test_hash"
 
     def test_concurrent_access(self, cache: FontCache, temp_dir: Path):
         """並行アクセスのテスト（簡易版）"""
@@ -19,7 +19,7 @@ class TestFontManager:
         assert font_manager.font_extensions == (".otf", ".ttf", ".OTF", ".TTF")
         assert font_manager.font_install_dir == Path.home() / "Library" / "Fonts"
         assert font_manager.max_font_size_mb == 200
-        assert font_manager.chunk_size == 8192
+        assert font_manager.chunk_size == 1 << 20
 
     def test_scan_fonts(self, mock_sync_folder: Path):
         """フォントスキャンのテスト"""
@@ -132,12 +132,9 @@ class TestFontManager:
         with pytest.raises(FileNotFoundError):
             font_manager.calculate_hash(Path("/non/existent/file.otf"))
 
-    def test_copy_font_with_validation(self, sample_font_file: Path, mock_font_install_dir: Path, monkeypatch):
+    def test_copy_font_with_validation(self, sample_font_file: Path, installed_font_manager):
         """検証付きフォントコピーのテスト"""
-        font_manager = FontManager()
-
-        # font_install_dirをモック
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         # OTFヘッダーを持つファイルを作成
         sample_font_file.write_bytes(b'OTTO' + b'\x00' * 100)
@@ -149,10 +146,9 @@ class TestFontManager:
         assert dst_path.exists()
         assert dst_path.read_bytes() == sample_font_file.read_bytes()
 
-    def test_copy_font_safe_filename(self, temp_dir: Path, mock_font_install_dir: Path, monkeypatch):
+    def test_copy_font_safe_filename(self, temp_dir: Path, installed_font_manager):
         """安全なファイル名への変換テスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         # 無効な文字を含むファイル名（コロンはmacOSで使えないので別の文字を使用）
         unsafe_font = temp_dir / "Font_with_invalid_chars.otf"
@@ -171,10 +167,9 @@ class TestFontManager:
         dst_path2 = font_manager.copy_font(safe_font, validate=True)
         assert dst_path2.name == "SafeFont.otf"
 
-    def test_copy_font_disk_space_check(self, sample_font_file: Path, mock_font_install_dir: Path, monkeypatch):
+    def test_copy_font_disk_space_check(self, sample_font_file: Path, installed_font_manager):
         """ディスク容量チェックのテスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         # OTTOヘッダーを持つファイルを作成
         sample_font_file.write_bytes(b'OTTO' + b'\x00' * 100)
@@ -211,10 +206,9 @@ class TestFontManager:
         with pytest.raises(FileNotFoundError):
             font_manager.copy_font(Path("/non/existent/font.otf"))
 
-    def test_is_font_installed_with_safe_name(self, mock_font_install_dir: Path, monkeypatch):
+    def test_is_font_installed_with_safe_name(self, mock_font_install_dir: Path, installed_font_manager):
         """安全なファイル名でのインストール確認テスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         # 無効な文字を含むフォント名
         original_name = "Font:with*invalid?.otf"
@@ -226,10 +220,9 @@ class TestFontManager:
         # 元の名前でも確認できることをテスト
         assert font_manager.is_font_installed(original_name) is True
 
-    def test_get_installed_font_path(self, mock_font_install_dir: Path, monkeypatch):
+    def test_get_installed_font_path(self, mock_font_install_dir: Path, installed_font_manager):
         """インストール済みフォントパス取得のテスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         font_name = "TestFont.otf"
 
@@ -244,10 +237,9 @@ class TestFontManager:
         result = font_manager.get_installed_font_path(font_name)
         assert result == font_path
 
-    def test_remove_font_with_retry(self, mock_font_install_dir: Path, monkeypatch):
+    def test_remove_font_with_retry(self, mock_font_install_dir: Path, installed_font_manager):
         """リトライ機能付きフォント削除のテスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         font_name = "TestFont.otf"
         font_path = mock_font_install_dir / font_name
@@ -265,10 +257,9 @@ class TestFontManager:
         result = font_manager.remove_font("NonExistent.otf")
         assert result is False
 
-    def test_remove_font_locked(self, mock_font_install_dir: Path, monkeypatch):
+    def test_remove_font_locked(self, mock_font_install_dir: Path, installed_font_manager):
         """ロックされたフォントの削除テスト"""
-        font_manager = FontManager()
-        monkeypatch.setattr(font_manager, "font_install_dir", mock_font_install_dir)
+        font_manager = installed_font_manager
 
         font_name = "LockedFont.otf"
         font_path = mock_font_install_dir / font_name